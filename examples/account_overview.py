@@ -204,23 +204,22 @@ class AccountOverview:
         print("\n=== Open Orders ===")
         orders_data = []
         for order in open_orders:
-            # Get order details
-            order_id = order.order_id if hasattr(order, 'order_id') else "Unknown"
-            order_type = order.order_type if hasattr(order, 'order_type') else "Unknown"
-            status = order.status if hasattr(order, 'status') else "Unknown"
-            quantity = order.quantity if hasattr(order, 'quantity') else 0
-            price = order.price if hasattr(order, 'price') and order.price else None
-            entered_time = order.entered_time if hasattr(order, 'entered_time') else None
+            # Get order details (declared model fields, so always present)
+            order_id = order.order_id
+            order_type = order.order_type
+            status = order.status
+            quantity = order.quantity
+            price = order.price or None
+            entered_time = order.entered_time
             
             # Get symbol and instruction from order legs
             symbol = "Unknown"
             instruction = "Unknown"
-            if hasattr(order, 'order_leg_collection') and order.order_leg_collection:
+            if order.order_leg_collection:
                 first_leg = order.order_leg_collection[0]
-                if hasattr(first_leg, 'instrument') and hasattr(first_leg.instrument, 'symbol'):
-                    symbol = first_leg.instrument.symbol
-                if hasattr(first_leg, 'instruction'):
-                    instruction = first_leg.instruction
+                # instrument is untyped, so its symbol still needs a probe
+                symbol = getattr(first_leg.instrument, 'symbol', symbol)
+                instruction = first_leg.instruction
             
             orders_data.append([
                 order_id,
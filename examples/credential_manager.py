@@ -13,6 +13,8 @@ across all example scripts. It handles:
 import os
 import sqlite3
 import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Optional, Tuple
@@ -23,51 +25,91 @@ logger = logging.getLogger(__name__)
 # Database path - unified for all scripts
 DB_PATH = Path(__file__).parent / 'schwab_trader.db'
 
+# Applied once per connection; each save is then a single WAL append
+DB_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+"""
+
 class CredentialManager:
     """Manages Schwab API credentials and tokens in a unified database."""
     
     def __init__(self, db_path: Path = DB_PATH):
         """Initialize the credential manager with optional custom database path."""
         self.db_path = db_path
+        self._conn = None  # Opened lazily by _get_conn()
+        self._lock = threading.RLock()  # Serializes use of the connection
         self._ensure_database()
     
+    def _get_conn(self) -> sqlite3.Connection:
+        """Return this manager's SQLite connection, opening it on first use."""
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(
+                    self.db_path,
+                    check_same_thread=False,
+                    isolation_level=None
+                )
+                self._conn.executescript(DB_PRAGMAS)
+            return self._conn
+    
+    @contextmanager
+    def _transaction(self):
+        """Run statements on the connection as one locked transaction."""
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
     def _ensure_database(self):
         """Create database and tables if they don't exist."""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        
-        # Create credentials table
-        c.execute('''
-            CREATE TABLE IF NOT EXISTS credentials (
-                id INTEGER PRIMARY KEY,
-                name TEXT UNIQUE,
-                client_id TEXT,
-                client_secret TEXT,
-                redirect_uri TEXT,
-                trading_client_id TEXT NOT NULL,
-                trading_client_secret TEXT NOT NULL,
-                market_data_client_id TEXT,
-                market_data_client_secret TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Create tokens table
-        c.execute('''
-            CREATE TABLE IF NOT EXISTS tokens (
-                id INTEGER PRIMARY KEY,
-                api_type TEXT NOT NULL DEFAULT 'trading',
-                access_token TEXT NOT NULL,
-                refresh_token TEXT,
-                expiry TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        with self._transaction() as c:
+            # Create credentials table
+            c.execute('''
+                CREATE TABLE IF NOT EXISTS credentials (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT UNIQUE,
+                    client_id TEXT,
+                    client_secret TEXT,
+                    redirect_uri TEXT,
+                    trading_client_id TEXT NOT NULL,
+                    trading_client_secret TEXT NOT NULL,
+                    market_data_client_id TEXT,
+                    market_data_client_secret TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Create tokens table
+            c.execute('''
+                CREATE TABLE IF NOT EXISTS tokens (
+                    id INTEGER PRIMARY KEY,
+                    api_type TEXT NOT NULL DEFAULT 'trading',
+                    access_token TEXT NOT NULL,
+                    refresh_token TEXT,
+                    expiry TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
         
-        conn.commit()
-        conn.close()
+        # Credentials live in a single row with id=1, the key the portfolio GUI upserts on
+        with self._transaction() as c:
+            c.execute("DELETE FROM credentials WHERE id <> (SELECT MIN(id) FROM credentials)")
+            c.execute("UPDATE credentials SET id = 1 WHERE id <> 1")
     
     def save_credentials(self, client_id: str, client_secret: str, 
                         redirect_uri: str = "https://localhost:8443/callback",
@@ -85,29 +127,32 @@ class CredentialManager:
             bool: True if saved successfully
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            
-            # Clear existing credentials
-            c.execute("DELETE FROM credentials")
-            
-            # Insert new credentials
-            if api_type == "trading":
-                c.execute("""
-                    INSERT INTO credentials 
-                    (name, trading_client_id, trading_client_secret, redirect_uri)
-                    VALUES (?, ?, ?, ?)
-                """, ('default', client_id, client_secret, redirect_uri))
-            else:
-                # Update existing record with market data credentials
-                c.execute("""
-                    UPDATE credentials 
-                    SET market_data_client_id = ?, market_data_client_secret = ?
-                    WHERE id = (SELECT MAX(id) FROM credentials)
-                """, (client_id, client_secret))
+            with self._transaction() as c:
+                if api_type == "trading":
+                    # Replace the single credentials row, clearing any market data credentials
+                    c.execute("""
+                        INSERT INTO credentials 
+                        (id, name, trading_client_id, trading_client_secret, redirect_uri)
+                        VALUES (1, ?, ?, ?, ?)
+                        ON CONFLICT(id) DO UPDATE SET
+                            trading_client_id=excluded.trading_client_id,
+                            trading_client_secret=excluded.trading_client_secret,
+                            redirect_uri=excluded.redirect_uri,
+                            market_data_client_id=NULL,
+                            market_data_client_secret=NULL,
+                            client_id=NULL,
+                            client_secret=NULL,
+                            updated_at=CURRENT_TIMESTAMP
+                    """, ('default', client_id, client_secret, redirect_uri))
+                else:
+                    # Update existing record with market data credentials
+                    c.execute("""
+                        UPDATE credentials 
+                        SET market_data_client_id = ?, market_data_client_secret = ?,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE id = 1
+                    """, (client_id, client_secret))
             
-            conn.commit()
-            conn.close()
             logger.info(f"Saved {api_type} credentials successfully")
             return True
             
@@ -133,23 +178,25 @@ class CredentialManager:
             bool: True if saved successfully
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            
-            # Clear existing credentials
-            c.execute("DELETE FROM credentials")
-            
-            # Insert all credentials
-            c.execute("""
-                INSERT INTO credentials 
-                (name, trading_client_id, trading_client_secret, redirect_uri,
-                 market_data_client_id, market_data_client_secret)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, ('default', trading_client_id, trading_client_secret, redirect_uri,
-                  market_data_client_id, market_data_client_secret))
+            with self._transaction() as c:
+                # Replace the single credentials row
+                c.execute("""
+                    INSERT INTO credentials 
+                    (id, name, trading_client_id, trading_client_secret, redirect_uri,
+                     market_data_client_id, market_data_client_secret)
+                    VALUES (1, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        trading_client_id=excluded.trading_client_id,
+                        trading_client_secret=excluded.trading_client_secret,
+                        redirect_uri=excluded.redirect_uri,
+                        market_data_client_id=excluded.market_data_client_id,
+                        market_data_client_secret=excluded.market_data_client_secret,
+                        client_id=NULL,
+                        client_secret=NULL,
+                        updated_at=CURRENT_TIMESTAMP
+                """, ('default', trading_client_id, trading_client_secret, redirect_uri,
+                      market_data_client_id, market_data_client_secret))
             
-            conn.commit()
-            conn.close()
             logger.info("Saved all credentials successfully")
             return True
             
@@ -168,12 +215,10 @@ class CredentialManager:
             Dict with credentials or None if not found
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            
-            c.execute("SELECT * FROM credentials ORDER BY id DESC LIMIT 1")
-            row = c.fetchone()
-            conn.close()
+            with self._lock:
+                row = self._get_conn().execute(
+                    "SELECT * FROM credentials ORDER BY id DESC LIMIT 1"
+                ).fetchone()
             
             if not row:
                 return None
@@ -227,23 +272,19 @@ class CredentialManager:
             bool: True if saved successfully
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            
             # Calculate expiry time
             expiry = datetime.now() + timedelta(seconds=expires_in)
             
-            # Clear existing tokens for this API type
-            c.execute("DELETE FROM tokens WHERE api_type = ?", (api_type,))
-            
-            # Insert new tokens
-            c.execute("""
-                INSERT INTO tokens (api_type, access_token, refresh_token, expiry)
-                VALUES (?, ?, ?, ?)
-            """, (api_type, access_token, refresh_token, expiry.isoformat()))
+            with self._transaction() as c:
+                # Clear existing tokens for this API type
+                c.execute("DELETE FROM tokens WHERE api_type = ?", (api_type,))
+                
+                # Insert new tokens
+                c.execute("""
+                    INSERT INTO tokens (api_type, access_token, refresh_token, expiry)
+                    VALUES (?, ?, ?, ?)
+                """, (api_type, access_token, refresh_token, expiry.isoformat()))
             
-            conn.commit()
-            conn.close()
             logger.info(f"Saved {api_type} tokens successfully")
             return True
             
@@ -262,19 +303,14 @@ class CredentialManager:
             Dict with token info including validity status, or None if not found
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            
-            c.execute("""
-                SELECT access_token, refresh_token, expiry 
-                FROM tokens 
-                WHERE api_type = ? 
-                ORDER BY id DESC 
-                LIMIT 1
-            """, (api_type,))
-            
-            row = c.fetchone()
-            conn.close()
+            with self._lock:
+                row = self._get_conn().execute("""
+                    SELECT access_token, refresh_token, expiry 
+                    FROM tokens 
+                    WHERE api_type = ? 
+                    ORDER BY id DESC 
+                    LIMIT 1
+                """, (api_type,)).fetchone()
             
             if not row:
                 return None
@@ -299,14 +335,10 @@ class CredentialManager:
     def clear_all(self) -> bool:
         """Clear all credentials and tokens from the database."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            
-            c.execute("DELETE FROM credentials")
-            c.execute("DELETE FROM tokens")
+            with self._transaction() as c:
+                c.execute("DELETE FROM credentials")
+                c.execute("DELETE FROM tokens")
             
-            conn.commit()
-            conn.close()
             logger.info("Cleared all credentials and tokens")
             return True
             
@@ -13,11 +13,12 @@ This module provides a comprehensive order entry dialog that supports:
 import tkinter as tk
 from tkinter import messagebox, ttk
 import customtkinter as ctk
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 import logging
 from typing import Dict, List, Optional, Any, Tuple
 import asyncio
+import queue
 import threading
 
 # Schwab imports
@@ -30,14 +31,41 @@ try:
         RequestedDestination, StopPriceLinkBasis, StopPriceLinkType,
         StopType, TaxLotMethod, SpecialInstruction
     )
+    
+    # Option action -> (order instruction, position effect)
+    _INSTRUCTION_MAP = {
+        "BUY_TO_OPEN": (OrderInstruction.BUY, PositionEffect.OPENING),
+        "BUY_TO_CLOSE": (OrderInstruction.BUY, PositionEffect.CLOSING),
+        "SELL_TO_OPEN": (OrderInstruction.SELL, PositionEffect.OPENING),
+        "SELL_TO_CLOSE": (OrderInstruction.SELL, PositionEffect.CLOSING)
+    }
+    _ORDER_TYPE_MAP = {
+        name: OrderType[name] for name in ("MARKET", "LIMIT", "STOP", "STOP_LIMIT")
+    }
 except ImportError:
     # For development without schwab package
     Order = OrderType = OrderSession = OrderDuration = None
     OrderInstruction = ComplexOrderStrategyType = OrderStrategyType = None
     OrderLeg = OrderLegType = PositionEffect = None
+    _INSTRUCTION_MAP = {}
+    _ORDER_TYPE_MAP = {}
 
 logger = logging.getLogger(__name__)
 
+_CHAIN_MAPS = ('callExpDateMap', 'putExpDateMap')
+
+_ZERO = Decimal("0")
+
+# How often the dialog checks for the result of an order placed on a worker thread
+_ORDER_POLL_MS = 100
+
+
+def _to_decimal(value) -> Decimal:
+    """Convert a numeric value to Decimal, reusing it if it already is one."""
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
 class EnhancedOrderDialog(ctk.CTkToplevel):
     """Enhanced order entry dialog with comprehensive order type support."""
     
@@ -56,6 +84,15 @@ class EnhancedOrderDialog(ctk.CTkToplevel):
         self.option_chain_data = {}
         self.selected_option = None
         self.option_symbols = []
+        self._option_rows: Dict[str, Dict[str, float]] = {}  # symbol -> numeric row shown in option_tree
+        self._exp_dates_parsed: Dict[str, date] = {}  # expiration menu value -> date
+        self._exp_keys: Dict[str, Dict[date, str]] = {}  # chain map name -> {date: "YYYY-MM-DD:N" key}
+        
+        # Pre-bound formatters for option chain rows
+        self._fmt2 = '{:.2f}'.format
+        self._fmt3 = '{:.3f}'.format
+        self._fmt4 = '{:.4f}'.format
+        self._fmtInt = '{:,}'.format
         
         # Setup window
         self.title("Enhanced Order Entry")
@@ -254,7 +291,7 @@ class EnhancedOrderDialog(ctk.CTkToplevel):
         preview_btn.pack(side="left", padx=(0, 5))
         
         # Submit button
-        submit_btn = ctk.CTkButton(
+        self.submit_btn = ctk.CTkButton(
             button_frame,
             text="Submit Order",
             command=self.submit_order,
@@ -262,7 +299,7 @@ class EnhancedOrderDialog(ctk.CTkToplevel):
             fg_color="green",
             hover_color="darkgreen"
         )
-        submit_btn.pack(side="left", padx=(0, 5))
+        self.submit_btn.pack(side="left", padx=(0, 5))
         
         # Cancel button
         cancel_btn = ctk.CTkButton(
@@ -900,11 +937,13 @@ class EnhancedOrderDialog(ctk.CTkToplevel):
             messagebox.showerror("Error", "Please enter a symbol")
             return
         
+        # Show loading message; the fetch runs once Tk has drawn it
+        self.selected_option_label.configure(text="Loading option chain...")
+        self.after_idle(self._load_option_chain_data, symbol)
+    
+    def _load_option_chain_data(self, symbol: str):
+        """Fetch and display the option chain for symbol."""
         try:
-            # Show loading message
-            self.selected_option_label.configure(text="Loading option chain...")
-            self.update_idletasks()
-            
             # Get option chain from API
             if hasattr(self.client, 'get_option_chain'):
                 chain_data = self.client.get_option_chain(
@@ -931,25 +970,23 @@ class EnhancedOrderDialog(ctk.CTkToplevel):
     
     def process_option_chain(self, chain_data):
         """Process and display option chain data."""
-        # Extract expiration dates
-        expirations = set()
-        
-        # Process call options
-        if 'callExpDateMap' in chain_data:
-            for exp_date in chain_data['callExpDateMap'].keys():
-                # Format: "2024-01-19:7"
-                date_part = exp_date.split(':')[0]
-                expirations.add(date_part)
+        # Index expiration keys ("2024-01-19:7") by date for each option map
+        self._exp_keys = {}
+        for map_name in _CHAIN_MAPS:
+            self._exp_keys[map_name] = {
+                date.fromisoformat(exp_key[:10]): exp_key
+                for exp_key in chain_data.get(map_name, {})
+            }
         
-        # Process put options
-        if 'putExpDateMap' in chain_data:
-            for exp_date in chain_data['putExpDateMap'].keys():
-                date_part = exp_date.split(':')[0]
-                expirations.add(date_part)
+        expirations = set()
+        for exp_index in self._exp_keys.values():
+            expirations.update(exp_index)
         
         # Update expiration menu
         if expirations:
-            exp_list = sorted(list(expirations))
+            sorted_dates = sorted(expirations)
+            self._exp_dates_parsed = {exp.isoformat(): exp for exp in sorted_dates}
+            exp_list = list(self._exp_dates_parsed)
             self.expiration_menu.configure(values=exp_list)
             self.expiration_var.set(exp_list[0])
             
@@ -964,25 +1001,20 @@ class EnhancedOrderDialog(ctk.CTkToplevel):
             return
         
         # Clear existing items
-        for item in self.option_tree.get_children():
-            self.option_tree.delete(item)
+        self.option_tree.delete(*self.option_tree.get_children())
+        self._option_rows.clear()
         
         option_type = self.option_type_var.get()
         expiration = self.expiration_var.get()
         strike_filter = self.strike_filter_var.get()
         
         # Get the appropriate option map
-        if option_type == "CALL":
-            option_map = self.option_chain_data.get('callExpDateMap', {})
-        else:
-            option_map = self.option_chain_data.get('putExpDateMap', {})
+        map_name = 'callExpDateMap' if option_type == "CALL" else 'putExpDateMap'
+        option_map = self.option_chain_data.get(map_name, {})
         
         # Find matching expiration
-        exp_key = None
-        for key in option_map.keys():
-            if key.startswith(expiration):
-                exp_key = key
-                break
+        target_date = self._exp_dates_parsed.get(expiration)
+        exp_key = self._exp_keys.get(map_name, {}).get(target_date)
         
         if not exp_key:
             return
@@ -1034,8 +1066,10 @@ class EnhancedOrderDialog(ctk.CTkToplevel):
     def add_option_to_tree(self, option: Dict[str, Any]):
         """Add an option to the tree view."""
         try:
-            # Extract option data
+            # Extract option data; the symbol is the row id, so skip blank or repeated ones
             symbol = option.get('symbol', '')
+            if not symbol or symbol in self._option_rows:
+                return
             strike = float(option.get('strikePrice', 0))
             bid = float(option.get('bid', 0))
             ask = float(option.get('ask', 0))
@@ -1050,21 +1084,23 @@ class EnhancedOrderDialog(ctk.CTkToplevel):
             theta = float(option.get('theta', 0))
             vega = float(option.get('vega', 0))
             
-            # Add to tree
-            self.option_tree.insert("", "end", values=(
-                f"{strike:.2f}",
-                f"{bid:.2f}",
-                f"{ask:.2f}",
-                f"{last:.2f}",
-                f"{volume:,}",
-                f"{open_interest:,}",
-                f"{iv:.2f}",
-                f"{delta:.3f}",
-                f"{gamma:.4f}",
-                f"{theta:.4f}",
-                f"{vega:.4f}"
-            ), tags=(symbol,))
+            # Add to tree, keyed by option symbol
+            fmt2, fmt3, fmt4, fmt_int = self._fmt2, self._fmt3, self._fmt4, self._fmtInt
+            self.option_tree.insert("", "end", iid=symbol, values=(
+                fmt2(strike),
+                fmt2(bid),
+                fmt2(ask),
+                fmt2(last),
+                fmt_int(volume),
+                fmt_int(open_interest),
+                fmt2(iv),
+                fmt3(delta),
+                fmt4(gamma),
+                fmt4(theta),
+                fmt4(vega)
+            ))
             
+            self._option_rows[symbol] = {'strike': strike, 'bid': bid, 'ask': ask, 'last': last}
             self.option_symbols.append(symbol)
             
         except Exception as e:
@@ -1074,33 +1110,25 @@ class EnhancedOrderDialog(ctk.CTkToplevel):
         """Handle option selection from chain."""
         selection = self.option_tree.selection()
         if selection:
-            item = self.option_tree.item(selection[0])
-            values = item['values']
-            tags = item['tags']
+            row = self._option_rows.get(selection[0])
             
-            if tags:
-                self.selected_option = tags[0]
-                strike = values[0]
-                bid = values[1]
-                ask = values[2]
+            if row:
+                self.selected_option = selection[0]
+                bid = row['bid']
+                ask = row['ask']
                 
                 # Update display
                 self.selected_option_label.configure(
-                    text=f"Selected: {self.selected_option} (Strike: ${strike})"
+                    text=f"Selected: {self.selected_option} (Strike: ${row['strike']:.2f})"
                 )
                 
                 # Auto-populate price for limit orders
                 if self.option_order_type_var.get() == "LIMIT":
-                    try:
+                    if bid > 0 and ask > 0:
                         # Use mid-price
-                        bid_float = float(str(bid).replace(',', ''))
-                        ask_float = float(str(ask).replace(',', ''))
-                        if bid_float > 0 and ask_float > 0:
-                            mid_price = (bid_float + ask_float) / 2
-                            self.option_limit_entry.delete(0, 'end')
-                            self.option_limit_entry.insert(0, f"{mid_price:.2f}")
-                    except:
-                        pass
+                        mid_price = (bid + ask) / 2
+                        self.option_limit_entry.delete(0, 'end')
+                        self.option_limit_entry.insert(0, f"{mid_price:.2f}")
     
     def preview_order(self):
         """Preview the order before submission."""
@@ -1301,34 +1329,29 @@ class EnhancedOrderDialog(ctk.CTkToplevel):
         # Add other order types...
         
         # Place order
-        self.client.place_order(details['account'], order)
-        
-        messagebox.showinfo("Success", f"Order submitted for {details['symbol']}")
-        self.destroy()
+        self._place_order_async(details['account'], order, f"Order submitted for {details['symbol']}")
     
     def submit_option_order(self):
         """Submit option order."""
         details = self.get_option_order_details()
         
         # Map instruction to order instruction and position effect
-        instruction_map = {
-            "BUY_TO_OPEN": (OrderInstruction.BUY, PositionEffect.OPENING),
-            "BUY_TO_CLOSE": (OrderInstruction.BUY, PositionEffect.CLOSING),
-            "SELL_TO_OPEN": (OrderInstruction.SELL, PositionEffect.OPENING),
-            "SELL_TO_CLOSE": (OrderInstruction.SELL, PositionEffect.CLOSING)
-        }
+        try:
+            instruction, position_effect = _INSTRUCTION_MAP[details['instruction']]
+        except KeyError:
+            raise ValueError(f"Unsupported option instruction: {details['instruction']}")
         
-        instruction, position_effect = instruction_map[details['instruction']]
+        quantity = _to_decimal(details['quantity'])
         
         # Create option order
         order = Order(
             session=OrderSession.NORMAL,
             duration=OrderDuration.DAY,
-            order_type=OrderType[details['order_type']],
+            order_type=_ORDER_TYPE_MAP[details['order_type']],
             complex_order_strategy_type=ComplexOrderStrategyType.NONE,
-            quantity=Decimal(str(details['quantity'])),
-            filled_quantity=Decimal("0"),
-            remaining_quantity=Decimal(str(details['quantity'])),
+            quantity=quantity,
+            filled_quantity=_ZERO,
+            remaining_quantity=quantity,
             order_strategy_type=OrderStrategyType.SINGLE,
             order_leg_collection=[
                 OrderLeg(
@@ -1341,21 +1364,61 @@ class EnhancedOrderDialog(ctk.CTkToplevel):
                     },
                     instruction=instruction,
                     position_effect=position_effect,
-                    quantity=Decimal(str(details['quantity']))
+                    quantity=quantity
                 )
             ]
         )
         
         # Add price if limit order
         if details['order_type'] == "LIMIT" and details['limit_price']:
-            order.price = Decimal(str(details['limit_price']))
+            order.price = _to_decimal(details['limit_price'])
         
         # Place order
-        self.client.place_order(details['account'], order)
+        self._place_order_async(details['account'], order, f"Option order submitted for {details['symbol']}")
+    
+    def _place_order_async(self, account_hash: str, order: 'Order', success_message: str):
+        """Place an order on a worker thread so the dialog stays responsive.
+        
+        The worker never touches Tk; it queues its result for the dialog to poll.
+        """
+        self.submit_btn.configure(state="disabled")
+        results = queue.SimpleQueue()
+        
+        def worker():
+            try:
+                self.client.place_order(account_hash, order)
+            except Exception as e:
+                # Log here so the outcome is recorded even if the dialog was closed meanwhile
+                logger.error(f"Error submitting order: {e}")
+                results.put((self._on_submit_failed, e))
+            else:
+                logger.info(success_message)
+                results.put((self._on_submit_done, success_message))
         
-        messagebox.showinfo("Success", f"Option order submitted for {details['symbol']}")
+        threading.Thread(target=worker, daemon=True).start()
+        self.after(_ORDER_POLL_MS, self._poll_order_result, results)
+    
+    def _poll_order_result(self, results: queue.SimpleQueue):
+        """Deliver the worker's result on the Tk thread once it is ready."""
+        if not self.winfo_exists():
+            return
+        try:
+            callback, arg = results.get_nowait()
+        except queue.Empty:
+            self.after(_ORDER_POLL_MS, self._poll_order_result, results)
+            return
+        callback(arg)
+    
+    def _on_submit_done(self, message: str):
+        """Report a placed order on the Tk thread and close the dialog."""
+        messagebox.showinfo("Success", message)
         self.destroy()
     
+    def _on_submit_failed(self, error: Exception):
+        """Report a failed order on the Tk thread and allow resubmitting."""
+        messagebox.showerror("Order Error", f"Failed to submit order: {str(error)}")
+        self.submit_btn.configure(state="normal")
+    
     def submit_spread_order(self):
         """Submit spread order."""
         # Implementation for spread orders
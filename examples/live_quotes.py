@@ -12,6 +12,11 @@ import signal
 import json
 import base64
 from pathlib import Path
+try:
+    import uvloop
+except ImportError:
+    # Optional faster event loop; fall back to the default asyncio loop
+    uvloop = None
 # Add parent directory to path for schwab imports
 # Add examples directory to path for credential_manager imports
 _script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -257,6 +262,9 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\nExiting...")
\ No newline at end of file
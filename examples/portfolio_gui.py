@@ -9,17 +9,22 @@ Features modern UI design, real-time charts, advanced order management, and comp
 import os
 import sys
 import json
+import math
 import webbrowser
 import threading
-import time
 import logging
-import queue
 import sqlite3
+import traceback
 from typing import Dict, List, Optional, Any, Tuple
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, unquote
+from urllib.request import pathname2url
 from datetime import datetime, timedelta
 from decimal import Decimal
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from types import SimpleNamespace
 import asyncio
 
 # GUI imports
@@ -33,6 +38,7 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import matplotlib.dates as mdates
 from matplotlib.animation import FuncAnimation
+from matplotlib.patches import Rectangle
 
 # Image handling
 from PIL import Image, ImageTk, ImageDraw
@@ -95,14 +101,64 @@ formatter = logging.Formatter('%(asctime)s - [CHART] %(levelname)s - %(message)s
 ch.setFormatter(formatter)
 chart_logger.addHandler(ch)
 
+# Logger for database setup and migration problems
+db_logger = logging.getLogger('portfolio_gui.db')
+
 # Constants
 DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schwab_trader.db')
 PREFERENCES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'user_preferences.json')
 ICONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons')
 
+# Applied once to the shared SQLite connection. WAL + synchronous=NORMAL turns
+# each token/credential commit into a WAL append instead of a journal fsync pair.
+DB_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-8000;
+"""
+DB_CACHED_STATEMENTS = 256
+# Read-only URI for the reader connection; query_only guards against stray writes
+DB_READER_URI = "file:" + pathname2url(DB_PATH) + "?mode=ro"
+
+# Fixed SQL text so sqlite3's statement cache reuses the prepared statements
+SQL_SELECT_CREDS = """
+    SELECT COALESCE(NULLIF(trading_client_id, ''), client_id) AS trading_client_id,
+           COALESCE(NULLIF(trading_client_secret, ''), client_secret) AS trading_client_secret,
+           redirect_uri, market_data_client_id, market_data_client_secret
+    FROM credentials LIMIT 1
+"""
+SQL_UPSERT_CREDS = """
+    INSERT INTO credentials
+    (id, trading_client_id, trading_client_secret, redirect_uri,
+     market_data_client_id, market_data_client_secret)
+    VALUES (1, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        trading_client_id=excluded.trading_client_id,
+        trading_client_secret=excluded.trading_client_secret,
+        redirect_uri=excluded.redirect_uri,
+        market_data_client_id=excluded.market_data_client_id,
+        market_data_client_secret=excluded.market_data_client_secret,
+        client_id=NULL,
+        client_secret=NULL
+"""
+SQL_DELETE_CREDS = "DELETE FROM credentials"
+SQL_SELECT_TOKEN = "SELECT access_token, refresh_token, expiry FROM tokens WHERE api_type=? LIMIT 1"
+SQL_UPSERT_TOKEN = """
+    INSERT INTO tokens (api_type, access_token, refresh_token, expiry)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(api_type) DO UPDATE SET
+        access_token=excluded.access_token,
+        refresh_token=excluded.refresh_token,
+        expiry=excluded.expiry,
+        updated_at=CURRENT_TIMESTAMP
+"""
+SQL_DELETE_TOKENS = "DELETE FROM tokens"
+
 # Default settings
 DEFAULT_THEME = ("dark", "blue")
 DEFAULT_REFRESH_INTERVAL = 30  # seconds
+MAX_REFRESH_BACKOFF = 300  # seconds; longest wait while nothing changes
 DEFAULT_SYMBOLS = ["AAPL", "AMD", "AMZN", "GOOGL", "META", "MSFT", "NVDA", "TSLA", "SPY", "QQQ"]
 
 # Color schemes
@@ -127,6 +183,88 @@ THEME_COLORS = {
     }
 }
 
+# Fonts
+FONT_SMALL = ("Roboto", 11)
+FONT_BODY = ("Roboto", 12)
+FONT_BODY_BOLD = ("Roboto", 12, "bold")
+FONT_LABEL = ("Roboto", 14)
+FONT_LARGE = ("Roboto", 16)
+FONT_HEADER = ("Roboto", 16, "bold")
+FONT_TITLE = ("Roboto", 18, "bold")
+FONT_METRIC = ("Roboto", 20, "bold")
+FONT_VALUE = ("Roboto", 24, "bold")
+
+# Tab layouts
+PORTFOLIO_METRICS = (("Cash", "$0.00"), ("Securities", "$0.00"), ("Options", "$0.00"), ("Total", "$0.00"))
+POSITIONS_COLUMNS = ("Symbol", "Quantity", "Avg Cost", "Current Price", "Value", "P&L", "P&L %", "Day Change")
+ORDERS_COLUMNS = ("Order ID", "Symbol", "Type", "Quantity", "Price", "Status", "Time", "Account")
+HISTORY_COLUMNS = ("Date", "Type", "Symbol", "Description", "Amount", "Balance")
+ORDER_FILTERS = ("All", "Open", "Filled", "Cancelled", "Rejected")
+CHART_TIMEFRAMES = ("1D", "5D", "1M", "3M", "6M", "1Y", "5Y")
+CHART_TYPES = ["Line", "Candle", "Bar"]  # CTkOptionMenu expects a list
+DATE_RANGES = ("Today", "This Week", "This Month", "Last 30 Days", "Last 90 Days", "YTD", "All Time")
+COLUMN_WIDTHS = {
+    "P&L": 100,
+    "P&L %": 100,
+    "Day Change": 100,
+    "Order ID": 120,
+    "Status": 80,
+    "Type": 80,
+    "Price": 80,
+    "Quantity": 80
+}
+DEFAULT_COLUMN_WIDTH = 120
+
+# How far back refresh_orders looks for orders
+ORDERS_LOOKBACK = timedelta(days=7)
+
+
+@lru_cache(maxsize=1024)
+def format_order_time(entered_time):
+    """Format an order's entered time for the orders table; repeat refreshes hit the cache."""
+    return entered_time.strftime("%m/%d %H:%M")
+
+# Bound once for exception paths
+_format_exc = traceback.format_exc
+
+# Order enum lookup tables for the simple order dialog, built on first submit
+_ORDER_MODELS = None
+
+
+def _get_order_models():
+    """Return the cached order enum lookup tables used by the simple order dialog."""
+    global _ORDER_MODELS
+    if _ORDER_MODELS is None:
+        _ORDER_MODELS = SimpleNamespace(
+            durations={
+                "DAY": Duration.DAY,
+                "GTC": Duration.GOOD_TILL_CANCEL,
+                "IOC": Duration.IMMEDIATE_OR_CANCEL,
+                "FOK": Duration.FILL_OR_KILL
+            },
+            instructions={
+                "BUY": Instruction.BUY,
+                "SELL": Instruction.SELL,
+                "BUY_TO_COVER": Instruction.BUY_TO_COVER,
+                "SELL_SHORT": Instruction.SELL_SHORT
+            }
+        )
+    return _ORDER_MODELS
+
+
+def extract_auth_code(callback_url):
+    """Return the percent-decoded ``code`` parameter of an OAuth callback URL, or None."""
+    query = urlparse(callback_url).query
+    if query.startswith("code="):
+        start = 5
+    else:
+        start = query.find("&code=")
+        if start == -1:
+            return None
+        start += 6
+    end = query.find("&", start)
+    return unquote(query[start:end if end != -1 else None]) or None
+
 
 class ThemeManager:
     """Centralized theme management for the application."""
@@ -287,7 +425,7 @@ class ToastNotification(ctk.CTkToplevel):
         ctk.CTkLabel(
             frame,
             text=message,
-            font=("Roboto", 14),
+            font=FONT_LABEL,
             text_color="white"
         ).pack(padx=20, pady=10)
         
@@ -375,6 +513,9 @@ class AutocompleteEntry(ctk.CTkEntry):
 class PriceChartWidget(ctk.CTkFrame):
     """Enhanced price chart widget with candlestick and bar chart support."""
     
+    # Moving average window -> (color, label)
+    MA_STYLES = {20: ('#ff9900', 'MA20'), 50: ('#00aaff', 'MA50')}
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         
@@ -401,6 +542,14 @@ class PriceChartWidget(ctk.CTkFrame):
         # Keep a reference to prevent garbage collection
         self._canvas_widget = self.canvas.get_tk_widget()
         
+        # Blitting state: the price and moving average lines are animated so full
+        # draws leave them out of the cached background, letting live ticks
+        # redraw only those lines
+        self._price_line = None
+        self._ma_lines = []  # (window, line) for the moving averages of the line chart
+        self._blit_bg = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        
         # Store both simple and OHLCV data
         self.price_data = {"time": [], "price": [], "volume": []}
         self.ohlcv_data = {"time": [], "open": [], "high": [], "low": [], "close": [], "volume": []}
@@ -435,13 +584,59 @@ class PriceChartWidget(ctk.CTkFrame):
         
         # Keep only last 500 points for real-time data
         max_points = 500
-        if len(self.price_data["time"]) > max_points:
+        trimmed = len(self.price_data["time"]) > max_points
+        if trimmed:
             for key in self.price_data:
                 self.price_data[key] = self.price_data[key][-max_points:]
             for key in self.ohlcv_data:
                 self.ohlcv_data[key] = self.ohlcv_data[key][-max_points:]
         
-        self.redraw()
+        # Volume bars come from the OHLCV data when there is any, else from the
+        # raw ticks; they are not blitted, so any change to them needs a full draw
+        if self.ohlcv_data["volume"]:
+            volume_changed = open_price is not None
+        else:
+            volume_changed = bool(volume) or trimmed
+        
+        if volume_changed or not self._blit_price_line():
+            self.redraw()
+    
+    def _on_draw(self, event):
+        """Cache the price axes background after each full draw."""
+        self._blit_bg = self.canvas.copy_from_bbox(self.ax_price.bbox)
+        self._draw_animated()
+    
+    def _draw_animated(self):
+        """Draw the animated price and moving average lines."""
+        if self._price_line is not None:
+            self.ax_price.draw_artist(self._price_line)
+        for _, line in self._ma_lines:
+            self.ax_price.draw_artist(line)
+    
+    def _blit_price_line(self):
+        """Redraw only the price and moving average lines; returns False when a full redraw is needed."""
+        if self.chart_type != "Line" or self._price_line is None or self._blit_bg is None:
+            return False
+        
+        times = self.price_data["time"]
+        prices = self.price_data["price"]
+        x = self.ax_price.convert_xunits(times[-1])
+        y = prices[-1]
+        x0, x1 = self.ax_price.get_xlim()
+        y0, y1 = self.ax_price.get_ylim()
+        if not (x0 <= x <= x1 and y0 <= y <= y1):
+            return False
+        # A moving average appearing changes the legend too
+        if self._ma_windows(len(prices)) != tuple(window for window, _ in self._ma_lines):
+            return False
+        
+        self._price_line.set_data(times, prices)
+        for window, line in self._ma_lines:
+            line.set_data(times, self._moving_average(prices, window))
+        self.canvas.restore_region(self._blit_bg)
+        self._draw_animated()
+        self.canvas.blit(self.ax_price.bbox)
+        return True
     
     def set_historical_data(self, symbol, times, prices, volumes=None, opens=None, highs=None, lows=None):
         """Set historical data for the chart."""
@@ -480,9 +675,6 @@ class PriceChartWidget(ctk.CTkFrame):
             return
             
         # Group by time periods based on data density
-        from collections import defaultdict
-        import numpy as np
-        
         grouped = defaultdict(list)
         times = []
         
@@ -512,6 +704,8 @@ class PriceChartWidget(ctk.CTkFrame):
         
         self.ax_price.clear()
         self.ax_volume.clear()
+        self._price_line = None
+        self._ma_lines = []
         
         if not self.price_data["time"] and not self.ohlcv_data["time"]:
             # Show message when no data
@@ -556,19 +750,6 @@ class PriceChartWidget(ctk.CTkFrame):
         self.figure.tight_layout()
         self.canvas.draw()
         
-        # Force update the canvas
-        try:
-            self.canvas.flush_events()
-        except:
-            pass  # flush_events might not be available in all backends
-            
-        self.canvas.draw_idle()  # Use draw_idle for better performance
-        self.update_idletasks()
-        
-        # Ensure canvas is visible
-        if hasattr(self, '_canvas_widget'):
-            self._canvas_widget.update()
-        
         
     def _draw_line_chart(self):
         """Draw line chart."""
@@ -576,8 +757,8 @@ class PriceChartWidget(ctk.CTkFrame):
             return
         
             
-        self.ax_price.plot(self.price_data["time"], self.price_data["price"], 
-                    color='#00ff88', linewidth=2, label='Price')
+        self._price_line, = self.ax_price.plot(self.price_data["time"], self.price_data["price"], 
+                    color='#00ff88', linewidth=2, label='Price', animated=True)
         
         # Add moving averages
         self._add_moving_averages()
@@ -614,7 +795,6 @@ class PriceChartWidget(ctk.CTkFrame):
             else:
                 width = 0.0007  # Default width for last candle
                 
-            from matplotlib.patches import Rectangle
             rect = Rectangle((mdates.date2num(time) - width/2, bottom), width, height,
                            facecolor=color, edgecolor=color, alpha=0.8)
             self.ax_price.add_patch(rect)
@@ -664,28 +844,35 @@ class PriceChartWidget(ctk.CTkFrame):
         else:
             prices = self.price_data["price"]
             times = self.price_data["time"]
-            
-        if len(prices) > 20:
-            try:
-                import pandas as pd
-                ma20 = pd.Series(prices).rolling(20).mean()
-                self.ax_price.plot(times, ma20, 
-                            color='#ff9900', linewidth=1, label='MA20', alpha=0.7)
-                            
-                if len(prices) > 50:
-                    ma50 = pd.Series(prices).rolling(50).mean()
-                    self.ax_price.plot(times, ma50, 
-                                color='#00aaff', linewidth=1, label='MA50', alpha=0.7)
-            except ImportError:
-                # Simple moving average without pandas
-                ma20 = []
-                for i in range(len(prices)):
-                    if i < 19:
-                        ma20.append(prices[i])
-                    else:
-                        ma20.append(sum(prices[i-19:i+1]) / 20)
-                self.ax_price.plot(times, ma20, 
-                            color='#ff9900', linewidth=1, label='MA20', alpha=0.7)
+        
+        # Averages of the raw ticks are redrawn with the price line on live ticks
+        animated = prices is self.price_data["price"]
+        for window in self._ma_windows(len(prices)):
+            color, label = self.MA_STYLES[window]
+            line, = self.ax_price.plot(times, self._moving_average(prices, window),
+                        color=color, linewidth=1, label=label, alpha=0.7, animated=animated)
+            if animated:
+                self._ma_lines.append((window, line))
+    
+    @staticmethod
+    def _ma_windows(count):
+        """Moving average windows shown for count points; MA50 needs pandas."""
+        if count <= 20:
+            return ()
+        if pd is not None and count > 50:
+            return (20, 50)
+        return (20,)
+    
+    @staticmethod
+    def _moving_average(prices, window):
+        """Rolling mean of prices over window points."""
+        if pd is not None:
+            return pd.Series(prices).rolling(window).mean()
+        # Simple moving average without pandas
+        return [
+            prices[i] if i < window - 1 else sum(prices[i - window + 1:i + 1]) / window
+            for i in range(len(prices))
+        ]
                             
     def _draw_volume_bars(self):
         """Draw volume bars."""
@@ -723,6 +910,8 @@ class PriceChartWidget(ctk.CTkFrame):
         self.symbol = ""
         self.ax_price.clear()
         self.ax_volume.clear()
+        self._price_line = None
+        self._ma_lines = []
         self.canvas.draw()
 
 
@@ -732,6 +921,7 @@ class PerformanceDashboard(ctk.CTkFrame):
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         self.metric_labels = {}
+        self.metric_values = {}  # Last (text, color) shown per metric
         self.create_metric_cards()
         
     def create_metric_cards(self):
@@ -760,7 +950,7 @@ class PerformanceDashboard(ctk.CTkFrame):
         label_widget = ctk.CTkLabel(
             card, 
             text=label,
-            font=("Roboto", 12),
+            font=FONT_BODY,
             text_color="#888888"
         )
         label_widget.pack(pady=(10, 5))
@@ -768,7 +958,7 @@ class PerformanceDashboard(ctk.CTkFrame):
         value_widget = ctk.CTkLabel(
             card,
             text=value,
-            font=("Roboto", 20, "bold"),
+            font=FONT_METRIC,
             text_color=color
         )
         value_widget.pack(pady=(0, 10))
@@ -778,11 +968,14 @@ class PerformanceDashboard(ctk.CTkFrame):
         return card
         
     def update_metric(self, key, value, color=None):
-        """Update a specific metric."""
-        if key in self.metric_labels:
+        """Update a specific metric, skipping the redraw if nothing changed."""
+        if key not in self.metric_labels or self.metric_values.get(key) == (value, color):
+            return
+        self.metric_values[key] = (value, color)
+        if color:
+            self.metric_labels[key].configure(text=value, text_color=color)
+        else:
             self.metric_labels[key].configure(text=value)
-            if color:
-                self.metric_labels[key].configure(text_color=color)
                 
     def update_all_metrics(self, metrics_dict):
         """Update all metrics from a dictionary."""
@@ -800,10 +993,12 @@ class PerformanceDashboard(ctk.CTkFrame):
 class WatchlistWidget(ctk.CTkScrollableFrame):
     """Enhanced watchlist with mini charts."""
     
-    def __init__(self, parent, on_symbol_click=None, **kwargs):
+    def __init__(self, parent, on_symbol_click=None, on_symbol_remove=None, **kwargs):
         super().__init__(parent, **kwargs)
         self.watched_items = {}
+        self.item_pool = []  # Hidden rows from removed symbols, reused by add_symbol
         self.on_symbol_click = on_symbol_click
+        self.on_symbol_remove = on_symbol_remove
         
     def add_symbol(self, symbol, current_price, change_pct, change_dollar):
         """Add symbol to watchlist."""
@@ -811,13 +1006,26 @@ class WatchlistWidget(ctk.CTkScrollableFrame):
             self.update_symbol(symbol, current_price, change_pct, change_dollar)
             return
             
+        # Reuse a hidden row if one is available
+        item = self.item_pool.pop() if self.item_pool else self._create_item()
+        item["symbol"] = symbol
+        item["prices"] = []
+        item["symbol_label"].configure(text=symbol)
+        self._show_values(item, current_price, change_pct, change_dollar)
+        item["frame"].pack(fill="x", padx=5, pady=2)
+        
+        self.watched_items[symbol] = item
+        
+    def _create_item(self):
+        """Create the widgets for one watchlist row."""
+        item = {}
+        
         # Create watchlist item
         item_frame = ctk.CTkFrame(self, corner_radius=8, fg_color="#2a2a2a")
-        item_frame.pack(fill="x", padx=5, pady=2)
         
         # Make clickable
         if self.on_symbol_click:
-            item_frame.bind("<Button-1>", lambda e: self.on_symbol_click(symbol))
+            item_frame.bind("<Button-1>", lambda e: self.on_symbol_click(item["symbol"]))
             item_frame.configure(cursor="hand2")
         
         # Symbol and price info
@@ -826,16 +1034,16 @@ class WatchlistWidget(ctk.CTkScrollableFrame):
         
         symbol_label = ctk.CTkLabel(
             info_frame,
-            text=symbol,
-            font=("Roboto", 16, "bold"),
+            text="",
+            font=FONT_HEADER,
             text_color="white"
         )
         symbol_label.pack(anchor="w")
         
         price_label = ctk.CTkLabel(
             info_frame,
-            text=f"${current_price:.2f}",
-            font=("Roboto", 14),
+            text="",
+            font=FONT_LABEL,
             text_color="#cccccc"
         )
         price_label.pack(anchor="w")
@@ -844,14 +1052,10 @@ class WatchlistWidget(ctk.CTkScrollableFrame):
         change_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
         change_frame.pack(side="right", padx=10)
         
-        change_color = "#00ff88" if change_pct >= 0 else "#ff4444"
-        arrow = "▲" if change_pct >= 0 else "▼"
-        
         change_label = ctk.CTkLabel(
             change_frame,
-            text=f"{arrow} ${abs(change_dollar):.2f} ({abs(change_pct):.2f}%)",
-            font=("Roboto", 12, "bold"),
-            text_color=change_color
+            text="",
+            font=FONT_BODY_BOLD
         )
         change_label.pack()
         
@@ -865,27 +1069,24 @@ class WatchlistWidget(ctk.CTkScrollableFrame):
             text="×",
             width=25,
             height=25,
-            font=("Roboto", 16),
+            font=FONT_LARGE,
             fg_color="#ff4444",
             hover_color="#cc0000",
-            command=lambda: self.remove_symbol(symbol)
+            command=lambda: self.remove_symbol(item["symbol"])
         )
         delete_btn.pack(side="right", padx=5)
         
-        self.watched_items[symbol] = {
+        item.update({
             "frame": item_frame,
+            "symbol_label": symbol_label,
             "price_label": price_label,
             "change_label": change_label,
-            "chart_frame": chart_frame,
-            "prices": []
-        }
+            "chart_frame": chart_frame
+        })
+        return item
         
-    def update_symbol(self, symbol, current_price, change_pct, change_dollar):
-        """Update symbol in watchlist."""
-        if symbol not in self.watched_items:
-            return
-            
-        item = self.watched_items[symbol]
+    def _show_values(self, item, current_price, change_pct, change_dollar):
+        """Write price and change text into a row's labels."""
         item["price_label"].configure(text=f"${current_price:.2f}")
         
         change_color = "#00ff88" if change_pct >= 0 else "#ff4444"
@@ -895,16 +1096,27 @@ class WatchlistWidget(ctk.CTkScrollableFrame):
             text_color=change_color
         )
         
+    def update_symbol(self, symbol, current_price, change_pct, change_dollar):
+        """Update symbol in watchlist."""
+        if symbol not in self.watched_items:
+            return
+            
+        item = self.watched_items[symbol]
+        self._show_values(item, current_price, change_pct, change_dollar)
+        
         # Update sparkline data
         item["prices"].append(current_price)
         if len(item["prices"]) > 20:
             item["prices"].pop(0)
             
     def remove_symbol(self, symbol):
-        """Remove symbol from watchlist."""
-        if symbol in self.watched_items:
-            self.watched_items[symbol]["frame"].destroy()
-            del self.watched_items[symbol]
+        """Remove symbol from watchlist, keeping its row widgets for reuse."""
+        item = self.watched_items.pop(symbol, None)
+        if item is not None:
+            item["frame"].pack_forget()
+            self.item_pool.append(item)
+            if self.on_symbol_remove:
+                self.on_symbol_remove(symbol)
             
     def get_symbols(self):
         """Get list of watched symbols."""
@@ -948,8 +1160,9 @@ class EnhancedTreeview(ttk.Treeview):
         for col in columns:
             self.heading(col, command=lambda c=col: self.sort_column(c, False))
             
-        # Store original items for filtering
-        self.all_items = []
+        # Stored row data for filtering, keyed by item id
+        self.all_items = {}
+        self._sort_state = None  # (column, reverse) of the active sort, re-applied after filtering
     
     def _apply_theme(self):
         """Apply theme to ttk widgets."""
@@ -971,6 +1184,19 @@ class EnhancedTreeview(ttk.Treeview):
             
     def sort_column(self, col, reverse):
         """Sort treeview by column."""
+        self._sort_state = (col, reverse)
+        self._apply_sort(col, reverse)
+            
+        # Update header to show sort direction
+        for column in self['columns']:
+            self.heading(column, text=column)
+        self.heading(col, text=f"{col} {'↓' if reverse else '↑'}")
+        
+        # Toggle sort direction for next click
+        self.heading(col, command=lambda: self.sort_column(col, not reverse))
+        
+    def _apply_sort(self, col, reverse):
+        """Reorder the visible rows by col."""
         items = [(self.set(child, col), child) for child in self.get_children('')]
         
         # Try numeric sort first, fall back to string sort
@@ -982,49 +1208,107 @@ class EnhancedTreeview(ttk.Treeview):
             
         for index, (val, child) in enumerate(items):
             self.move(child, '', index)
-            
-        # Update header to show sort direction
-        for column in self['columns']:
-            self.heading(column, text=column)
-        self.heading(col, text=f"{col} {'↓' if reverse else '↑'}")
-        
-        # Toggle sort direction for next click
-        self.heading(col, command=lambda: self.sort_column(col, not reverse))
         
     def filter_items(self, *args):
-        """Filter items based on search text."""
+        """Filter items based on search text, keeping the active column sort."""
         search_text = self.search_var.get().lower()
         
-        # Clear current items
-        for item in self.get_children(''):
-            self.delete(item)
-            
-        # Re-add filtered items
-        for item_data in self.all_items:
+        # Detach non-matching rows and re-attach matching ones in stored order
+        index = 0
+        for iid, item_data in self.all_items.items():
             # Check if search text is in any column
             if not search_text or any(search_text in str(val).lower() for val in item_data['values']):
-                self.insert('', 'end', values=item_data['values'], tags=item_data.get('tags', ()))
+                self.move(iid, '', index)
+                index += 1
+            else:
+                self.detach(iid)
+        
+        if self._sort_state:
+            self._apply_sort(*self._sort_state)
                 
     def insert(self, parent, index, **kwargs):
         """Override insert to store items for filtering."""
+        iid = super().insert(parent, index, **kwargs)
+        
         # Store item data
         if parent == '' and 'values' in kwargs:
-            self.all_items.append({
+            self.all_items[iid] = {
                 'values': kwargs['values'],
                 'tags': kwargs.get('tags', ())
-            })
-        return super().insert(parent, index, **kwargs)
+            }
+        return iid
         
     def delete(self, *items):
         """Override delete to update stored items."""
         for item in items:
-            # Remove from stored items
-            try:
-                values = self.item(item)['values']
-                self.all_items = [i for i in self.all_items if i['values'] != values]
-            except:
-                pass
+            self.all_items.pop(item, None)
         return super().delete(*items)
+    
+    def clear(self):
+        """Delete all rows, including rows hidden by the current filter."""
+        items = dict.fromkeys(self.get_children(''))
+        items.update(dict.fromkeys(self.all_items))
+        if items:
+            self.delete(*items)
+    
+    def replace_rows(self, rows):
+        """Replace every row in one pass.
+        
+        Rows are inserted in reverse at index 0; Tk walks the sibling list to
+        find 'end', so appending N rows one by one is quadratic.
+        
+        Args:
+            rows: Ordered dict of item id -> (values, tags)
+        """
+        self.clear()
+        insert = super().insert
+        for iid, (values, tags) in reversed(rows.items()):
+            insert('', 0, iid=iid, values=values, tags=tags)
+            
+        # Keep all_items in display order for filter_items
+        self.all_items = {iid: {'values': values, 'tags': tags} for iid, (values, tags) in rows.items()}
+        
+        # New rows were inserted unfiltered and unsorted; apply an active search or sort
+        if self.search_var.get() or self._sort_state:
+            self.filter_items()
+    
+    def update_item(self, iid, values, tags=()):
+        """Update the values and tags of an existing row in place."""
+        self.item(iid, values=values, tags=tags)
+        self.all_items[iid] = {'values': values, 'tags': tags}
+    
+    def sync_rows(self, rows):
+        """Show exactly the given rows, only touching rows that changed.
+        
+        Args:
+            rows: Ordered dict of item id -> (values, tags)
+        """
+        if not self.all_items:
+            self.replace_rows(rows)
+            return
+            
+        stale = [iid for iid in self.all_items if iid not in rows]
+        if stale:
+            self.delete(*stale)
+        
+        changed = False
+        for iid, (values, tags) in rows.items():
+            current = self.all_items.get(iid)
+            if current is None:
+                self.insert('', 'end', iid=iid, values=values, tags=tags)
+                changed = True
+            elif current['values'] != values or current['tags'] != tags:
+                self.update_item(iid, values, tags)
+                changed = True
+                
+        reordered = list(self.all_items) != list(rows)
+        if reordered:
+            self.all_items = {iid: self.all_items[iid] for iid in rows}
+            
+        # Reposition rows when the order changed, and re-check an active search
+        # or sort when inserted or edited rows may now match it or move
+        if reordered or (changed and (self.search_var.get() or self._sort_state)):
+            self.filter_items()
 
 
 class OrderTemplateManager(ctk.CTkToplevel):
@@ -1054,7 +1338,7 @@ class OrderTemplateManager(ctk.CTkToplevel):
         ctk.CTkLabel(
             list_frame,
             text="Saved Templates",
-            font=("Roboto", 18, "bold")
+            font=FONT_TITLE
         ).pack(pady=(0, 10))
         
         # Template listbox with theme-aware colors
@@ -1066,7 +1350,7 @@ class OrderTemplateManager(ctk.CTkToplevel):
             fg=colors['fg_color'],
             selectbackground=colors['select_bg'],
             selectforeground="white",
-            font=("Roboto", 12),
+            font=FONT_BODY,
             borderwidth=0,
             highlightthickness=0
         )
@@ -1102,7 +1386,7 @@ class OrderTemplateManager(ctk.CTkToplevel):
         ctk.CTkLabel(
             editor_frame,
             text="Template Details",
-            font=("Roboto", 18, "bold")
+            font=FONT_TITLE
         ).pack(pady=(0, 10))
         
         # Template fields
@@ -1236,7 +1520,7 @@ class StatusBar(ctk.CTkFrame):
             self,
             text="● Disconnected",
             text_color="#ff4444",
-            font=("Roboto", 12)
+            font=FONT_BODY
         )
         self.connection_label.pack(side="left", padx=10)
         
@@ -1244,7 +1528,7 @@ class StatusBar(ctk.CTkFrame):
         self.market_status = ctk.CTkLabel(
             self,
             text="Market: Unknown",
-            font=("Roboto", 12)
+            font=FONT_BODY
         )
         self.market_status.pack(side="left", padx=20)
         
@@ -1256,7 +1540,7 @@ class StatusBar(ctk.CTkFrame):
         self.account_info = ctk.CTkLabel(
             self,
             text="No Account Selected",
-            font=("Roboto", 12)
+            font=FONT_BODY
         )
         self.account_info.pack(side="left", padx=10)
         
@@ -1265,10 +1549,11 @@ class StatusBar(ctk.CTkFrame):
         self.last_update = ctk.CTkLabel(
             self,
             text="Last Update: Never",
-            font=("Roboto", 11),
+            font=FONT_SMALL,
             text_color="#888888"
         )
         self.last_update.pack(side="right", padx=10)
+        self._last_update_text = "Last Update: Never"
         
         # Separator
         sep2 = ctk.CTkFrame(self, width=2, fg_color="#444444")
@@ -1278,7 +1563,7 @@ class StatusBar(ctk.CTkFrame):
         self.refresh_rate = ctk.CTkLabel(
             self,
             text="Refresh: 30s",
-            font=("Roboto", 11),
+            font=FONT_SMALL,
             text_color="#888888"
         )
         self.refresh_rate.pack(side="right", padx=5)
@@ -1306,9 +1591,10 @@ class StatusBar(ctk.CTkFrame):
         
     def update_last_update(self):
         """Update last update timestamp."""
-        self.last_update.configure(
-            text=f"Last Update: {datetime.now().strftime('%H:%M:%S')}"
-        )
+        text = f"Last Update: {datetime.now():%H:%M:%S}"
+        if text != self._last_update_text:
+            self._last_update_text = text
+            self.last_update.configure(text=text)
         
     def update_refresh_rate(self, seconds):
         """Update refresh rate display."""
@@ -1350,7 +1636,7 @@ class SettingsDialog(ctk.CTkToplevel):
         title_label = ctk.CTkLabel(
             main_frame,
             text="Application Settings",
-            font=("Roboto", 24, "bold")
+            font=FONT_VALUE
         )
         title_label.pack(pady=(0, 20))
         
@@ -1361,7 +1647,7 @@ class SettingsDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             theme_frame,
             text="Theme Settings",
-            font=("Roboto", 16, "bold")
+            font=FONT_HEADER
         ).pack(pady=(10, 10), padx=10, anchor="w")
         
         # Appearance mode
@@ -1371,7 +1657,7 @@ class SettingsDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             appearance_frame,
             text="Appearance Mode:",
-            font=("Roboto", 12)
+            font=FONT_BODY
         ).pack(side="left", padx=(0, 10))
         
         current_theme = self.preferences.get("theme", DEFAULT_THEME)
@@ -1391,7 +1677,7 @@ class SettingsDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             color_frame,
             text="Color Theme:",
-            font=("Roboto", 12)
+            font=FONT_BODY
         ).pack(side="left", padx=(0, 10))
         
         self.color_var = ctk.StringVar(value=current_theme[1])
@@ -1410,7 +1696,7 @@ class SettingsDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             refresh_frame,
             text="Data Refresh Settings",
-            font=("Roboto", 16, "bold")
+            font=FONT_HEADER
         ).pack(pady=(10, 10), padx=10, anchor="w")
         
         interval_frame = ctk.CTkFrame(refresh_frame)
@@ -1419,7 +1705,7 @@ class SettingsDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             interval_frame,
             text="Refresh Interval (seconds):",
-            font=("Roboto", 12)
+            font=FONT_BODY
         ).pack(side="left", padx=(0, 10))
         
         self.refresh_var = ctk.IntVar(value=self.preferences.get("refresh_interval", DEFAULT_REFRESH_INTERVAL))
@@ -1435,7 +1721,7 @@ class SettingsDialog(ctk.CTkToplevel):
         self.refresh_label = ctk.CTkLabel(
             interval_frame,
             text=f"{self.refresh_var.get()}s",
-            font=("Roboto", 12)
+            font=FONT_BODY
         )
         self.refresh_label.pack(side="left")
         
@@ -1487,15 +1773,37 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         # Initialize variables
         self.client = None
         self.auth = None
+        self._auth_url_cache = {}  # (client_id, redirect_uri) -> authorization URL
         self.portfolio_manager = None
+        self._shown_portfolio = (None, None)  # (portfolio manager, revision) last sent to the views
+        self._portfolio_update = (None, None)  # (portfolio manager, future of its in-flight update())
         self.order_monitor = None
         self.streamer_client = None
         self.accounts = []
-        self.update_thread = None
-        self.stop_updates = threading.Event()
-        self.update_queue = queue.Queue()
-        self.watched_symbols = set()
+        self.account_data = []  # (account_number, hash_value) pairs
+        self.account_labels = {}  # hash_value -> "*1234"
+        self.account_by_label = {}  # "*1234" -> hash_value
+        self._order_accounts = {}  # orders tree item id (order id) -> account hash
+        self._position_state = {}  # positions tree item id -> numeric quantity/avg_cost
+        self._updates_active = False  # Periodic refreshes are running
+        self._update_job = None  # after() id of the next periodic refresh
+        self._update_delay = None  # Seconds until the next refresh; doubles while nothing changes
+        self._last_quotes = {}  # Quotes from the previous periodic fetch
+        self.price_history = {}  # symbol -> list of (time, price) tuples
+        self.update_deque = deque()  # Filled by worker threads, drained on <<SchwabUpdate>>
+        self._update_pending = False  # True while a <<SchwabUpdate>> event is queued
+        self._update_pending_lock = threading.Lock()
+        # Replaced (never mutated) under _watched_lock so the update thread can read it lock-free
+        self.watched_symbols = frozenset()
+        self._watched_lock = threading.Lock()
         self.previous_close_prices = {}  # Store previous close prices
+        self._db_conn = None  # Opened lazily by get_db()
+        self._db_lock = threading.RLock()  # Serializes use of the shared connection
+        self._db_reader = None  # Read-only connection opened lazily by get_db_reader()
+        self._db_reader_lock = threading.RLock()  # Serializes use of the reader connection
+        self._io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="schwab-io")
+        self._closing = False  # Set by on_closing; worker callbacks stop posting to Tk
+        self._orders_futures = []  # Latest refresh_orders batch; older batches are dropped
         self.preferences = self.load_preferences()
         
         # Initialize managers
@@ -1511,7 +1819,7 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         self.setup_ttk_theme()
         
         # Start background tasks
-        self.process_update_queue()
+        self.bind("<<SchwabUpdate>>", self._drain_updates)
         self.start_market_status_checker()
         
         # Apply saved preferences
@@ -1580,8 +1888,8 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
     def create_menu_bar(self):
         """Create application menu bar."""
         # Create a custom menu bar frame instead of using tk.Menu
+        # Fixed-height frame; it is packed once all its buttons exist
         self.menu_frame = ctk.CTkFrame(self, height=30, corner_radius=0)
-        self.menu_frame.pack(fill="x", side="top")
         self.menu_frame.pack_propagate(False)
         
         # Menu items
@@ -1625,6 +1933,8 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
                 command=lambda m=menu_name, items=menu_items_list: self.show_menu_dropdown(m, items)
             )
             menu_btn.pack(side="left", padx=2)
+            
+        self.menu_frame.pack(fill="x", side="top")
     
     def show_menu_dropdown(self, menu_name, items):
         """Show dropdown menu for a menu button."""
@@ -1677,7 +1987,7 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         watchlist_label = ctk.CTkLabel(
             left_panel,
             text="Watchlist",
-            font=("Roboto", 18, "bold")
+            font=FONT_TITLE
         )
         watchlist_label.pack(pady=(10, 5))
         
@@ -1703,7 +2013,8 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         # Watchlist widget
         self.watchlist = WatchlistWidget(
             left_panel,
-            on_symbol_click=self.on_watchlist_symbol_click
+            on_symbol_click=self.on_watchlist_symbol_click,
+            on_symbol_remove=self.remove_watched_symbol
         )
         self.watchlist.pack(fill="both", expand=True, padx=10, pady=5)
         
@@ -1724,8 +2035,8 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         
     def create_toolbar(self):
         """Create application toolbar."""
+        # Fixed-height frame; it is packed once all its children exist
         toolbar = ctk.CTkFrame(self, height=50)
-        toolbar.pack(fill="x", padx=5, pady=5)
         toolbar.pack_propagate(False)
         
         # Connection section
@@ -1788,9 +2099,11 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         )
         theme_menu.pack(side="left")
         
+        toolbar.pack(fill="x", padx=5, pady=5)
+        
     def create_tabs(self, parent):
         """Create tabbed interface."""
-        self.tab_view = ctk.CTkTabview(parent)
+        self.tab_view = ctk.CTkTabview(parent, command=self._on_tab_changed)
         self.tab_view.pack(fill="both", expand=True, padx=10, pady=(0, 10))
         
         # Portfolio tab
@@ -1807,11 +2120,31 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         
         # Charts tab
         self.charts_tab = self.tab_view.add("📉 Charts")
-        self.create_charts_tab()
         
         # History tab
         self.history_tab = self.tab_view.add("📜 History")
-        self.create_history_tab()
+        
+        # Charts (matplotlib canvas) and History are built on first selection;
+        # Portfolio, Positions and Orders are fed by refresh_data so stay eager
+        self._tab_builders = {
+            "📉 Charts": self.create_charts_tab,
+            "📜 History": self.create_history_tab
+        }
+        
+    def _on_tab_changed(self):
+        """Build the selected tab's contents the first time it is shown."""
+        self._build_tab(self.tab_view.get())
+        
+    def _build_tab(self, name):
+        """Run a deferred tab builder once."""
+        builder = self._tab_builders.pop(name, None)
+        if builder:
+            builder()
+            
+    def show_tab(self, name):
+        """Switch to a tab, building it first if needed."""
+        self._build_tab(name)
+        self.tab_view.set(name)
         
     def create_portfolio_tab(self):
         """Create portfolio overview tab."""
@@ -1819,16 +2152,12 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         summary_frame = ctk.CTkFrame(self.portfolio_tab)
         summary_frame.pack(fill="x", pady=10)
         
-        # Create summary metrics with label references
+        # Create summary metrics with label references. Cards are built once
+        # here and only their text changes afterwards (see set_portfolio_label)
         self.portfolio_labels = {}  # Store references to value labels
-        metrics = [
-            ("Cash", "$0.00"),
-            ("Securities", "$0.00"),
-            ("Options", "$0.00"),
-            ("Total", "$0.00")
-        ]
+        self.portfolio_label_text = {}
         
-        for i, (label, value) in enumerate(metrics):
+        for i, (label, value) in enumerate(PORTFOLIO_METRICS):
             card = ctk.CTkFrame(summary_frame, corner_radius=8)
             card.grid(row=0, column=i, padx=5, sticky="nsew")
             summary_frame.grid_columnconfigure(i, weight=1)
@@ -1836,14 +2165,14 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
             ctk.CTkLabel(
                 card,
                 text=label,
-                font=("Roboto", 14),
+                font=FONT_LABEL,
                 text_color="#888888"
             ).pack(pady=(10, 5))
             
             value_label = ctk.CTkLabel(
                 card,
                 text=value,
-                font=("Roboto", 24, "bold")
+                font=FONT_VALUE
             )
             value_label.pack(pady=(0, 10))
             
@@ -1860,20 +2189,27 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         self.allocation_ax = self.allocation_figure.add_subplot(111)
         self.allocation_canvas = FigureCanvasTkAgg(self.allocation_figure, chart_frame)
         self.allocation_canvas.get_tk_widget().pack(fill="both", expand=True)
+        self._allocation_pie = None  # (asset types, sizes, wedges, texts, autotexts) of the drawn pie
+        
+    def set_portfolio_label(self, key, text):
+        """Set a portfolio summary card's value text if it changed."""
+        if self.portfolio_label_text.get(key) != text:
+            self.portfolio_label_text[key] = text
+            self.portfolio_labels[key].configure(text=text)
         
     def create_positions_tab(self):
         """Create positions tab."""
         # Positions table
-        columns = ["Symbol", "Quantity", "Avg Cost", "Current Price", "Value", "P&L", "P&L %", "Day Change"]
-        
         self.positions_tree = EnhancedTreeview(
             self.positions_tab,
-            columns=columns,
+            columns=POSITIONS_COLUMNS,
             show="headings"
         )
         
         # Configure columns
-        self.configure_treeview_columns(self.positions_tree, columns)
+        self.configure_treeview_columns(self.positions_tree, POSITIONS_COLUMNS)
+        self.positions_tree.tag_configure("gain", foreground="#00ff88")
+        self.positions_tree.tag_configure("loss", foreground="#ff4444")
                 
         self.positions_tree.pack(fill="both", expand=True, padx=10, pady=10)
         
@@ -1897,10 +2233,9 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         controls_frame.pack(fill="x", padx=10, pady=10)
         
         # Filter buttons
-        filters = ["All", "Open", "Filled", "Cancelled", "Rejected"]
         self.order_filter_var = ctk.StringVar(value="All")
         
-        for filter_name in filters:
+        for filter_name in ORDER_FILTERS:
             btn = ctk.CTkRadioButton(
                 controls_frame,
                 text=filter_name,
@@ -1919,16 +2254,17 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         ).pack(side="right", padx=5)
         
         # Orders table
-        columns = ["Order ID", "Symbol", "Type", "Quantity", "Price", "Status", "Time", "Account"]
-        
         self.orders_tree = EnhancedTreeview(
             self.orders_tab,
-            columns=columns,
+            columns=ORDERS_COLUMNS,
             show="headings"
         )
         
         # Configure columns
-        self.configure_treeview_columns(self.orders_tree, columns)
+        self.configure_treeview_columns(self.orders_tree, ORDERS_COLUMNS)
+        self.orders_tree.tag_configure("filled", foreground="#00ff88")
+        self.orders_tree.tag_configure("cancelled", foreground="#ff4444")
+        self.orders_tree.tag_configure("open", foreground="#00aaff")
             
         self.orders_tree.pack(fill="both", expand=True, padx=10, pady=(0, 10))
         
@@ -1971,10 +2307,9 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         load_btn.pack(side="left", padx=5)
         
         # Time frame selector
-        timeframes = ["1D", "5D", "1M", "3M", "6M", "1Y", "5Y"]
         self.timeframe_var = ctk.StringVar(value="1D")
         
-        for tf in timeframes:
+        for tf in CHART_TIMEFRAMES:
             btn = ctk.CTkButton(
                 controls_frame,
                 text=tf,
@@ -1988,7 +2323,7 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         self.chart_type_var = ctk.StringVar(value="Line")
         chart_types = ctk.CTkOptionMenu(
             controls_frame,
-            values=["Line", "Candle", "Bar"],
+            values=CHART_TYPES,
             variable=self.chart_type_var,
             command=self.change_chart_type,
             width=100
@@ -1999,9 +2334,6 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         self.main_chart = PriceChartWidget(self.charts_tab)
         self.main_chart.pack(fill="both", expand=True, padx=10, pady=(0, 10))
         
-        # Historical data storage
-        self.price_history = {}  # symbol -> list of (time, price) tuples
-        
     def create_history_tab(self):
         """Create transaction history tab."""
         # Date range selector
@@ -2011,10 +2343,9 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         ctk.CTkLabel(date_frame, text="Date Range:").pack(side="left", padx=5)
         
         # Quick date ranges
-        ranges = ["Today", "This Week", "This Month", "Last 30 Days", "Last 90 Days", "YTD", "All Time"]
         self.date_range_var = ctk.StringVar(value="Last 30 Days")
         
-        for range_name in ranges:
+        for range_name in DATE_RANGES:
             btn = ctk.CTkButton(
                 date_frame,
                 text=range_name,
@@ -2024,16 +2355,14 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
             btn.pack(side="left", padx=2)
             
         # History table
-        columns = ["Date", "Type", "Symbol", "Description", "Amount", "Balance"]
-        
         self.history_tree = EnhancedTreeview(
             self.history_tab,
-            columns=columns,
+            columns=HISTORY_COLUMNS,
             show="headings"
         )
         
         # Configure columns
-        self.configure_treeview_columns(self.history_tree, columns)
+        self.configure_treeview_columns(self.history_tree, HISTORY_COLUMNS)
             
         self.history_tree.pack(fill="both", expand=True, padx=10, pady=(0, 10))
         
@@ -2044,13 +2373,22 @@ class EnhancedSchwabPortfolioGUI(ctk.CTk):
         self.save_preferences()
         
         # Stop background tasks
-        self.stop_updates.set()
-        if self.update_thread:
-            self.update_thread.join(timeout=2)
+        self.stop_updates()
             
         # Close connections
         if self.order_monitor:
             self.order_monitor.stop_monitoring()
+        # Running futures still fire their done-callbacks after shutdown
+        self._closing = True
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        with self._db_lock:
+            if self._db_conn is not None:
+                self._db_conn.close()
+                self._db_conn = None
+        with self._db_reader_lock:
+            if self._db_reader is not None:
+                self._db_reader.close()
+                self._db_reader = None
             
         # Destroy window
         self.destroy()
@@ -2155,7 +2493,7 @@ A professional-grade trading interface for Charles Schwab.
         """Apply loaded preferences."""
         # Add watched symbols
         for symbol in self.preferences.get("watched_symbols", []):
-            self.watched_symbols.add(symbol)
+            self.add_watched_symbol(symbol)
             # Add to watchlist with dummy data for now
             self.watchlist.add_symbol(symbol, 0.0, 0.0, 0.0)
             
@@ -2163,92 +2501,181 @@ A professional-grade trading interface for Charles Schwab.
         refresh_interval = self.preferences.get("refresh_interval", DEFAULT_REFRESH_INTERVAL)
         self.status_bar.update_refresh_rate(refresh_interval)
         
-    def check_and_upgrade_db(self):
-        """Check and upgrade database schema."""
-        try:
-            conn = sqlite3.connect(DB_PATH)
-            c = conn.cursor()
-            
-            # Create tables if they dont exist
-            c.execute("""
-                CREATE TABLE IF NOT EXISTS credentials (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT UNIQUE,
-                    client_id TEXT,
-                    client_secret TEXT,
-                    redirect_uri TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    trading_client_id TEXT,
-                    trading_client_secret TEXT,
-                    market_data_client_id TEXT,
-                    market_data_client_secret TEXT
+    def get_db(self):
+        """Return the shared SQLite connection, opening it on first use.
+        
+        Callers hold self._db_lock while using the connection.
+        """
+        with self._db_lock:
+            if self._db_conn is None:
+                self._db_conn = sqlite3.connect(
+                    DB_PATH,
+                    check_same_thread=False,
+                    isolation_level=None,
+                    cached_statements=DB_CACHED_STATEMENTS
                 )
-            """)
-            
-            c.execute("""
-                CREATE TABLE IF NOT EXISTS tokens (
-                    id INTEGER PRIMARY KEY,
-                    api_type TEXT NOT NULL DEFAULT 'trading',
-                    access_token TEXT NOT NULL,
-                    refresh_token TEXT,
-                    expiry TEXT NOT NULL,
-                    expires_at TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                self._db_conn.row_factory = sqlite3.Row
+                self._db_conn.executescript(DB_PRAGMAS)
+            return self._db_conn
+        
+    def get_db_reader(self):
+        """Return the read-only SQLite connection used for SELECTs.
+        
+        Reads go through this connection under self._db_reader_lock so they
+        never wait on writers holding self._db_lock.
+        """
+        with self._db_reader_lock:
+            if self._db_reader is None:
+                self._db_reader = sqlite3.connect(
+                    DB_READER_URI,
+                    uri=True,
+                    check_same_thread=False,
+                    isolation_level=None,
+                    cached_statements=DB_CACHED_STATEMENTS
                 )
-            """)
-            
-            conn.commit()
-            conn.close()
-            
-        except Exception as e:
-            pass
+                self._db_reader.row_factory = sqlite3.Row
+                self._db_reader.execute("PRAGMA query_only=1")
+            return self._db_reader
+        
+    @contextmanager
+    def db_transaction(self):
+        """Run statements on the shared connection as one locked transaction."""
+        with self._db_lock:
+            conn = self.get_db()
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        
+    def check_and_upgrade_db(self):
+        """Check and upgrade database schema.
+        
+        Each step commits on its own, so a failed cleanup cannot roll back the
+        tables or the token index the upserts rely on. Failures are logged.
+        """
+        steps = (
+            ("create tables", (
+                """
+                    CREATE TABLE IF NOT EXISTS credentials (
+                        id INTEGER PRIMARY KEY,
+                        name TEXT UNIQUE,
+                        client_id TEXT,
+                        client_secret TEXT,
+                        redirect_uri TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        trading_client_id TEXT,
+                        trading_client_secret TEXT,
+                        market_data_client_id TEXT,
+                        market_data_client_secret TEXT
+                    )
+                """,
+                """
+                    CREATE TABLE IF NOT EXISTS tokens (
+                        id INTEGER PRIMARY KEY,
+                        api_type TEXT NOT NULL DEFAULT 'trading',
+                        access_token TEXT NOT NULL,
+                        refresh_token TEXT,
+                        expiry TEXT NOT NULL,
+                        expires_at TIMESTAMP,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """,
+            )),
+            # SQL_UPSERT_TOKEN needs one token row per api_type
+            ("index tokens by api_type", (
+                "DELETE FROM tokens WHERE id NOT IN (SELECT MAX(id) FROM tokens GROUP BY api_type)",
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_tokens_api_type ON tokens(api_type)",
+            )),
+            # SQL_UPSERT_CREDS needs a single credentials row with id=1
+            ("collapse credentials to id 1", (
+                "DELETE FROM credentials WHERE id <> (SELECT MIN(id) FROM credentials)",
+                "UPDATE credentials SET id = 1 WHERE id <> 1",
+            )),
+        )
+        for name, statements in steps:
+            try:
+                with self.db_transaction() as c:
+                    for sql in statements:
+                        c.execute(sql)
+            except Exception as e:
+                db_logger.error(f"Database upgrade step '{name}' failed: {e}")
             
     # Background tasks
-    def process_update_queue(self):
-        """Process updates from background threads."""
-        try:
-            while True:
-                update = self.update_queue.get_nowait()
-                if update["type"] == "portfolio":
-                    self.update_portfolio_display(update["data"])
-                elif update["type"] == "positions":
-                    self.update_positions_display(update["data"])
-                elif update["type"] == "orders":
-                    self.update_orders_display(update["data"])
-                elif update["type"] == "quote":
-                    self.update_quote_display(update["data"])
-        except queue.Empty:
-            pass
-            
-        # Schedule next update
-        self.after(100, self.process_update_queue)
+    def _post_update(self, update):
+        """Queue an update from a background thread and wake the Tk event loop.
+        
+        Only one <<SchwabUpdate>> is queued at a time; a burst of posts is
+        handled by a single drain. Updates posted once the window is closing
+        are dropped.
+        """
+        if self._closing:
+            return
+        self.update_deque.append(update)
+        with self._update_pending_lock:
+            if self._update_pending:
+                return
+            self._update_pending = True
+        self.event_generate("<<SchwabUpdate>>", when="tail")
+        
+    def _call_in_gui(self, func, *args):
+        """Run func(*args) on the Tk thread; safe to call from worker threads."""
+        self._post_update({"type": "call", "data": (func, args)})
+    
+    def _drain_updates(self, event=None):
+        """Apply all pending updates from background threads.
+        
+        Quote batches are merged so each symbol is redrawn once with its
+        latest quote.
+        """
+        # Clear first: anything posted from here on queues a fresh event
+        with self._update_pending_lock:
+            self._update_pending = False
+            
+        updates = self.update_deque
+        quotes = {}
+        while updates:
+            update = updates.popleft()
+            if update["type"] == "portfolio":
+                self.update_portfolio_display(update["data"])
+            elif update["type"] == "positions":
+                self.update_positions_display(update["data"])
+            elif update["type"] == "orders":
+                self.update_orders_display(update["data"])
+            elif update["type"] == "quotes":
+                quotes.update(update["data"])
+            elif update["type"] == "call":
+                func, args = update["data"]
+                try:
+                    func(*args)
+                except Exception:
+                    traceback.print_exc()
+        if quotes:
+            self.update_quote_display(quotes)
         
     def start_market_status_checker(self):
         """Start checking market status periodically."""
-        def check_market():
-            while not self.stop_updates.is_set():
-                try:
-                    # Check if market is open
-                    now = datetime.now()
-                    if now.weekday() < 5:  # Monday to Friday
-                        market_open = now.replace(hour=9, minute=30, second=0)
-                        market_close = now.replace(hour=16, minute=0, second=0)
-                        
-                        if market_open <= now <= market_close:
-                            self.after(0, self.status_bar.update_market_status, "Open")
-                        else:
-                            self.after(0, self.status_bar.update_market_status, "Closed")
-                    else:
-                        self.after(0, self.status_bar.update_market_status, "Weekend")
-                        
-                except Exception as e:
-                    pass
-                    
-                time.sleep(60)  # Check every minute
+        try:
+            # Check if market is open
+            now = datetime.now()
+            if now.weekday() < 5:  # Monday to Friday
+                market_open = now.replace(hour=9, minute=30, second=0)
+                market_close = now.replace(hour=16, minute=0, second=0)
+                
+                if market_open <= now <= market_close:
+                    self.status_bar.update_market_status("Open")
+                else:
+                    self.status_bar.update_market_status("Closed")
+            else:
+                self.status_bar.update_market_status("Weekend")
                 
-        thread = threading.Thread(target=check_market, daemon=True)
-        thread.start()
+        except Exception as e:
+            pass
+            
+        self.after(60000, self.start_market_status_checker)  # Check every minute
         
     # Connection and authentication methods
     def toggle_connection(self):
@@ -2269,9 +2696,7 @@ A professional-grade trading interface for Charles Schwab.
         """Disconnect from Schwab API."""
         try:
             # Stop updates
-            self.stop_updates.set()
-            if self.update_thread:
-                self.update_thread.join(timeout=1)
+            self.stop_updates()
             
             # Clear client and managers
             self.client = None
@@ -2280,20 +2705,16 @@ A professional-grade trading interface for Charles Schwab.
             self.auth = None
             
             # Clear data
-            self.accounts = []
-            self.account_data = []
+            self.set_accounts([])
             
             # Update UI
-            self.status_bar.update_connection_status(False, "Disconnected")
-            self.connect_btn.configure(text="Connect", fg_color="blue", hover_color="darkblue")
+            self._set_connection_state(False, "Disconnected")
             self.account_menu.configure(values=["Select Account"])
             self.account_var.set("Select Account")
             
             # Clear displays
-            for item in self.positions_tree.get_children():
-                self.positions_tree.delete(item)
-            for item in self.orders_tree.get_children():
-                self.orders_tree.delete(item)
+            self.positions_tree.clear()
+            self.orders_tree.clear()
             
             self.show_info("Disconnected from Schwab")
             
@@ -2303,30 +2724,23 @@ A professional-grade trading interface for Charles Schwab.
     def load_credentials(self):
         """Load saved credentials from database."""
         try:
-            conn = sqlite3.connect(DB_PATH)
-            c = conn.cursor()
-            
-            # Get credentials
-            c.execute("SELECT * FROM credentials LIMIT 1")
-            creds = c.fetchone()
+            # Get credentials (trading keys fall back to the legacy client_id/secret)
+            with self._db_reader_lock:
+                creds = self.get_db_reader().execute(SQL_SELECT_CREDS).fetchone()
             
             if creds:
                 # Try to connect with saved credentials
-                # Column mapping: 0=id, 1=name, 2=client_id, 3=client_secret, 4=redirect_uri, 
-                # 5=created_at, 6=trading_client_id, 7=trading_client_secret, 
-                # 8=market_data_client_id, 9=market_data_client_secret
+                client_id, client_secret, redirect_uri, md_client_id, md_client_secret = creds
                 self.connect_with_credentials(
-                    creds[6] or creds[2],  # trading_client_id (fallback to client_id)
-                    creds[7] or creds[3],  # trading_client_secret (fallback to client_secret)
-                    creds[4] or 'https://localhost:8443/callback',  # redirect_uri
-                    creds[8],  # market_data_client_id
-                    creds[9]   # market_data_client_secret
+                    client_id,
+                    client_secret,
+                    redirect_uri or 'https://localhost:8443/callback',
+                    md_client_id,
+                    md_client_secret
                 )
             else:
                 # No credentials found, show authentication dialog
                 self.show_auth_dialog()
-            
-            conn.close()
         except Exception as e:
             # Show auth dialog on error
             self.show_auth_dialog()
@@ -2353,7 +2767,7 @@ A professional-grade trading interface for Charles Schwab.
         ctk.CTkLabel(
             main_frame,
             text="Schwab API Authentication",
-            font=("Roboto", 20, "bold")
+            font=FONT_METRIC
         ).pack(pady=(0, 10))
         
         # Instructions
@@ -2372,7 +2786,7 @@ A professional-grade trading interface for Charles Schwab.
         ctk.CTkLabel(
             main_frame,
             text="Trading API Credentials",
-            font=("Roboto", 16, "bold")
+            font=FONT_HEADER
         ).pack(pady=(10, 5))
         
         # Client ID
@@ -2404,7 +2818,7 @@ A professional-grade trading interface for Charles Schwab.
         ctk.CTkLabel(
             main_frame,
             text="Market Data API Credentials (Optional)",
-            font=("Roboto", 16, "bold")
+            font=FONT_HEADER
         ).pack(pady=(20, 5))
         
         # Market Data Client ID
@@ -2441,22 +2855,12 @@ A professional-grade trading interface for Charles Schwab.
             
             # Save credentials to database
             try:
-                conn = sqlite3.connect(DB_PATH)
-                c = conn.cursor()
-                
-                # Clear existing credentials
-                c.execute("DELETE FROM credentials")
-                
-                # Insert new credentials
-                c.execute("""
-                    INSERT INTO credentials 
-                    (trading_client_id, trading_client_secret, redirect_uri, 
-                     market_data_client_id, market_data_client_secret)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (trading_id, trading_secret, redirect_uri, market_id, market_secret))
-                
-                conn.commit()
-                conn.close()
+                with self._db_lock:
+                    # Single credentials row (id=1), replaced in place
+                    self.get_db().execute(
+                        SQL_UPSERT_CREDS,
+                        (trading_id, trading_secret, redirect_uri, market_id, market_secret)
+                    )
                 
                 # Close dialog
                 auth_dialog.destroy()
@@ -2492,18 +2896,16 @@ A professional-grade trading interface for Charles Schwab.
             self.auth = SchwabAuth(trading_id, trading_secret, redirect_uri)
             
             # Check if we have saved tokens
-            conn = sqlite3.connect(DB_PATH)
-            c = conn.cursor()
-            c.execute("SELECT * FROM tokens WHERE api_type='trading' LIMIT 1")
-            token_data = c.fetchone()
+            with self._db_reader_lock:
+                token_data = self.get_db_reader().execute(SQL_SELECT_TOKEN, ("trading",)).fetchone()
             
             if token_data:
                 # Try to use existing tokens
-                self.auth.access_token = token_data[2]
-                self.auth.refresh_token = token_data[3]
-                if token_data[4]:  # Check if expiry is not empty
+                self.auth.access_token = token_data["access_token"]
+                self.auth.refresh_token = token_data["refresh_token"]
+                if token_data["expiry"]:  # Check if expiry is not empty
                     try:
-                        self.auth.token_expiry = datetime.fromisoformat(token_data[4])
+                        self.auth.token_expiry = datetime.fromisoformat(token_data["expiry"])
                     except ValueError:
                         self.auth.token_expiry = datetime.now() - timedelta(days=1)  # Force expired
                 
@@ -2522,22 +2924,20 @@ A professional-grade trading interface for Charles Schwab.
                             "Session expired. Please re-authenticate.",
                             "warning"
                         )
-                        conn.close()
                         self.start_oauth_flow()
                         return
             else:
                 # No tokens, start OAuth flow
-                conn.close()
                 self.start_oauth_flow()
                 return
             
             # Check for saved market data token and get a new one if needed
             if market_id and market_secret:
-                # Check for existing market data token using the same connection
-                c.execute("SELECT * FROM tokens WHERE api_type='market_data' LIMIT 1")
-                market_token_data = c.fetchone()
+                # Check for existing market data token
+                with self._db_reader_lock:
+                    market_token_data = self.get_db_reader().execute(SQL_SELECT_TOKEN, ("market_data",)).fetchone()
                 
-                if not market_token_data or not market_token_data[2]:
+                if not market_token_data or not market_token_data["access_token"]:
                     # No market data token, get one using client credentials
                     try:
                         print(f"Getting market data token using client credentials...")
@@ -2557,9 +2957,6 @@ A professional-grade trading interface for Charles Schwab.
                 else:
                     print(f"Using existing market data token from database")
             
-            # Close the database connection
-            conn.close()
-            
             # Initialize client with both trading and market data credentials
             self.client = SchwabClient(
                 trading_id, trading_secret, redirect_uri, 
@@ -2571,18 +2968,16 @@ A professional-grade trading interface for Charles Schwab.
             # Get accounts
             account_numbers = self.client.get_account_numbers()
             if not account_numbers.accounts:
-                messagebox.showwarning("No Accounts", "No accounts found. Please verify your credentials and ensure your Schwab account is properly linked.")
-                self.status_bar.update_connection_status(False, "No accounts")
+                self._set_connection_state(False, "No accounts", warning=("No Accounts", "No accounts found. Please verify your credentials and ensure your Schwab account is properly linked."))
                 return
 
             # Store both account numbers and hash values
-            self.account_data = [(acc.account_number, acc.hash_value) for acc in account_numbers.accounts]
-            self.accounts = [acc.hash_value for acc in account_numbers.accounts]  # Use hash values for API calls
+            self.set_accounts(account_numbers.accounts)
 
             # Update account menu
             if self.accounts:
-                self.account_menu.configure(values=[f"*{acc[0][-4:]}" for acc in self.account_data])
-                self.account_var.set(f"*{self.account_data[0][0][-4:]}")
+                self.account_menu.configure(values=list(self.account_labels.values()))
+                self.account_var.set(self.account_labels[self.accounts[0]])
             
             # Initialize portfolio manager
             if hasattr(self, 'portfolio_manager') and self.portfolio_manager:
@@ -2600,8 +2995,7 @@ A professional-grade trading interface for Charles Schwab.
             self.order_monitor = OrderMonitor(self.client)
             
             # Update connection status
-            self.status_bar.update_connection_status(True, "Active")
-            self.connect_btn.configure(text="Disconnect", fg_color="red", hover_color="darkred")
+            self._set_connection_state(True, "Active")
             
             # Start auto-refresh
             self.start_updates()
@@ -2612,15 +3006,21 @@ A professional-grade trading interface for Charles Schwab.
             ToastNotification.show_toast(self, "Connected to Schwab successfully!", "success", duration=3000)
 
         except Exception as e:
-            import traceback
             traceback.print_exc()  # Print full traceback to console
-            messagebox.showerror("Connection Error", f"Failed to connect: {str(e)}")
-            self.status_bar.update_connection_status(False, "Failed")
+            self._set_connection_state(False, "Failed", error=("Connection Error", f"Failed to connect: {str(e)}"))
 
+    def _get_auth_url(self):
+        """Return the authorization URL for the current auth, reusing it across dialog reopens."""
+        key = (self.auth.client_id, self.auth.redirect_uri)
+        auth_url = self._auth_url_cache.get(key)
+        if auth_url is None:
+            auth_url = self._auth_url_cache[key] = self.auth.get_authorization_url()
+        return auth_url
+        
     def start_oauth_flow(self):
         """Start the OAuth authentication flow."""
         # Get authorization URL
-        auth_url = self.auth.get_authorization_url()
+        auth_url = self._get_auth_url()
         
         # Show dialog with instructions
         oauth_dialog = ctk.CTkToplevel(self)
@@ -2643,7 +3043,7 @@ A professional-grade trading interface for Charles Schwab.
         ctk.CTkLabel(
             main_frame,
             text="Complete Authentication",
-            font=("Roboto", 20, "bold")
+            font=FONT_METRIC
         ).pack(pady=(0, 20))
         
         # Instructions
@@ -2702,17 +3102,15 @@ A professional-grade trading interface for Charles Schwab.
             
             try:
                 # Extract authorization code from URL
-                parsed = urlparse(callback_url)
-                params = parse_qs(parsed.query)
+                auth_code = extract_auth_code(callback_url)
                 
-                if 'code' not in params:
+                if not auth_code:
                     messagebox.showerror("Error", "No authorization code found in URL")
                     return
                 
-                auth_code = params['code'][0]
-                
                 # Exchange code for tokens
                 self.auth.exchange_code_for_tokens(auth_code)
+                self._auth_url_cache.clear()
                 
                 # Save tokens
                 self.save_tokens()
@@ -2769,49 +3167,32 @@ A professional-grade trading interface for Charles Schwab.
     def save_tokens(self, market_data_auth=None):
         """Save tokens to database."""
         try:
-            conn = sqlite3.connect(DB_PATH)
-            c = conn.cursor()
-            
-            # Clear existing tokens
-            c.execute("DELETE FROM tokens WHERE api_type='trading'")
-            
-            # Insert trading tokens
-            c.execute("""
-                INSERT INTO tokens (api_type, access_token, refresh_token, expiry)
-                VALUES (?, ?, ?, ?)
-            """, (
+            # Trading tokens, plus the market data token if provided
+            rows = [(
                 "trading",
                 self.auth.access_token,
                 self.auth.refresh_token,
                 self.auth.token_expiry.isoformat() if self.auth.token_expiry else ""
-            ))
-            
-            # Save market data token if provided
+            )]
             if market_data_auth and market_data_auth.access_token:
-                c.execute("DELETE FROM tokens WHERE api_type='market_data'")
-                c.execute("""
-                    INSERT INTO tokens (api_type, access_token, refresh_token, expiry)
-                    VALUES (?, ?, ?, ?)
-                """, (
+                rows.append((
                     "market_data",
                     market_data_auth.access_token,
                     market_data_auth.refresh_token or "",
                     market_data_auth.token_expiry.isoformat() if market_data_auth.token_expiry else ""
                 ))
             
-            conn.commit()
-            conn.close()
+            # Upsert them (one row per api_type) in a single commit
+            with self.db_transaction() as c:
+                c.executemany(SQL_UPSERT_TOKEN, rows)
         except Exception as e:
             raise
     
     def clear_tokens(self):
         """Clear all saved tokens from database."""
         try:
-            conn = sqlite3.connect(DB_PATH)
-            c = conn.cursor()
-            c.execute("DELETE FROM tokens")
-            conn.commit()
-            conn.close()
+            with self._db_lock:
+                self.get_db().execute(SQL_DELETE_TOKENS)
         except Exception as e:
             pass
     
@@ -2823,17 +3204,13 @@ A professional-grade trading interface for Charles Schwab.
                 self.disconnect_from_schwab()
             
             # Clear all authentication data from database
-            conn = sqlite3.connect(DB_PATH)
-            c = conn.cursor()
-            
-            # Clear credentials
-            c.execute("DELETE FROM credentials")
-            
-            # Clear tokens
-            c.execute("DELETE FROM tokens")
-            
-            conn.commit()
-            conn.close()
+            with self.db_transaction() as c:
+                # Clear credentials
+                c.execute(SQL_DELETE_CREDS)
+                
+                # Clear tokens
+                c.execute(SQL_DELETE_TOKENS)
+            self._auth_url_cache.clear()
             
             # Show success message
             ToastNotification.show_toast(
@@ -2853,19 +3230,15 @@ A professional-grade trading interface for Charles Schwab.
         """Finalize the connection after successful authentication."""
         try:
             # Get stored credentials
-            conn = sqlite3.connect(DB_PATH)
-            c = conn.cursor()
-            c.execute("SELECT * FROM credentials LIMIT 1")
-            creds = c.fetchone()
-            conn.close()
+            with self._db_reader_lock:
+                creds = self.get_db_reader().execute(SQL_SELECT_CREDS).fetchone()
             
             if creds:
-                # Get credentials from correct columns
-                trading_id = creds[6] or creds[2]
-                trading_secret = creds[7] or creds[3]
-                redirect_uri = creds[4] or 'https://localhost:8443/callback'
-                market_data_id = creds[8]
-                market_data_secret = creds[9]
+                trading_id = creds["trading_client_id"]
+                trading_secret = creds["trading_client_secret"]
+                redirect_uri = creds["redirect_uri"] or 'https://localhost:8443/callback'
+                market_data_id = creds["market_data_client_id"]
+                market_data_secret = creds["market_data_client_secret"]
                 
                 # Get market data token if credentials are provided
                 market_data_auth = None
@@ -2895,17 +3268,15 @@ A professional-grade trading interface for Charles Schwab.
                 # Get accounts
                 account_numbers = self.client.get_account_numbers()
                 if not account_numbers.accounts:
-                    messagebox.showwarning("No Accounts", "No accounts found. Please verify your credentials and ensure your Schwab account is properly linked.")
-                    self.status_bar.update_connection_status(False, "No accounts")
+                    self._set_connection_state(False, "No accounts", warning=("No Accounts", "No accounts found. Please verify your credentials and ensure your Schwab account is properly linked."))
                     return
 
-                self.account_data = [(acc.account_number, acc.hash_value) for acc in account_numbers.accounts]
-                self.accounts = [acc.hash_value for acc in account_numbers.accounts]
+                self.set_accounts(account_numbers.accounts)
 
                 # Update account menu
                 if self.accounts:
-                    self.account_menu.configure(values=[f"*{acc[0][-4:]}" for acc in self.account_data])
-                    self.account_var.set(f"*{self.account_data[0][0][-4:]}")
+                    self.account_menu.configure(values=list(self.account_labels.values()))
+                    self.account_var.set(self.account_labels[self.accounts[0]])
                 
                 # Initialize portfolio manager
                 self.portfolio_manager = PortfolioManager(self.client)
@@ -2919,8 +3290,7 @@ A professional-grade trading interface for Charles Schwab.
                 self.order_monitor = OrderMonitor(self.client)
                 
                 # Update connection status
-                self.status_bar.update_connection_status(True, "Active")
-                self.connect_btn.configure(text="Disconnect", fg_color="red", hover_color="darkred")
+                self._set_connection_state(True, "Active")
                 
                 # Start auto-refresh
                 self.start_updates()
@@ -2931,43 +3301,74 @@ A professional-grade trading interface for Charles Schwab.
                 ToastNotification.show_toast(self, "Connected to Schwab successfully!", "success", duration=3000)
                 
         except Exception as e:
-            import traceback
             traceback.print_exc()  # Print full traceback to console
-            messagebox.showerror("Connection Error", f"Failed to connect: {str(e)}")
-            self.status_bar.update_connection_status(False, "Failed")
+            self._set_connection_state(False, "Failed", error=("Connection Error", f"Failed to connect: {str(e)}"))
 
+    def _set_connection_state(self, connected, status, warning=None, error=None):
+        """Show the connection state on the status bar and connect button.
+        
+        warning/error are optional (title, message) pairs shown in a dialog
+        after the widgets are updated.
+        """
+        self.status_bar.update_connection_status(connected, status)
+        if connected:
+            self.connect_btn.configure(text="Disconnect", fg_color="red", hover_color="darkred")
+        else:
+            self.connect_btn.configure(text="Connect", fg_color="blue", hover_color="darkblue")
+            
+        if error:
+            messagebox.showerror(*error)
+        elif warning:
+            messagebox.showwarning(*warning)
+            
     def refresh_data(self):
-        """Refresh all data."""
+        """Refresh all data.
+        
+        The portfolio fetch runs on the I/O pool; every view is then updated
+        together in a single Tk callback so they repaint in one pass.
+        """
         if self.client and self.portfolio_manager:
-            try:
-                # Update portfolio
-                self.portfolio_manager.update()
-                
-                # Debug: Log positions count
-                total_positions = 0
-                for account_num in self.portfolio_manager._positions:
-                    positions_dict = self.portfolio_manager._positions.get(account_num, {})
-                    total_positions += len(positions_dict)
-                
-                # Update UI
+            future = self._submit_portfolio_update()
+            future.add_done_callback(lambda f: self._call_in_gui(self._on_data_refreshed, f))
+            
+    def _submit_portfolio_update(self):
+        """Start portfolio_manager.update() on the I/O pool, or join the one already running.
+        
+        Manual refreshes and periodic ticks share one in-flight fetch instead of
+        updating the same manager twice at once. Called on the Tk thread.
+        """
+        manager, future = self._portfolio_update
+        if manager is not self.portfolio_manager or future is None or future.done():
+            future = self._io_pool.submit(self.portfolio_manager.update)
+            self._portfolio_update = (self.portfolio_manager, future)
+        return future
+            
+    def _on_data_refreshed(self, future):
+        """Update all views after refresh_data's background fetch completes."""
+        try:
+            future.result()
+            # A fetch just succeeded, so stop waiting out any failure backoff
+            self._reset_update_backoff()
+            
+            # Update UI
+            if self._take_portfolio_revision(self.portfolio_manager):
                 self.update_portfolio_display()
                 self.update_positions_display()
-                self.refresh_orders()
-                
-                # Update last refresh time
-                self.status_bar.update_last_update()
-                
-            except Exception as e:
-                if "401" in str(e) or "unauthorized" in str(e).lower():
-                    self.handle_auth_error()
-                else:
-                    ToastNotification.show_toast(self, f"Refresh error: {str(e)}", "error")
+            self.refresh_orders()
+            
+            # Update last refresh time
+            self.status_bar.update_last_update()
+            
+        except Exception as e:
+            if "401" in str(e) or "unauthorized" in str(e).lower():
+                self.handle_auth_error()
+            else:
+                ToastNotification.show_toast(self, f"Refresh error: {str(e)}", "error")
     
     def handle_auth_error(self):
         """Handle authentication errors by prompting for re-authentication."""
         # Update UI to show disconnected state
-        self.status_bar.update_connection_status(False, "Auth Error")
-        self.connect_btn.configure(text="Connect", fg_color="blue", hover_color="darkblue")
+        self._set_connection_state(False, "Auth Error")
         
         # Show message to user
         result = messagebox.askyesno(
@@ -2978,87 +3379,166 @@ A professional-grade trading interface for Charles Schwab.
         
         if result:
             # Get stored credentials
-            conn = sqlite3.connect(DB_PATH)
-            c = conn.cursor()
-            c.execute("SELECT * FROM credentials LIMIT 1")
-            creds = c.fetchone()
-            conn.close()
+            with self._db_reader_lock:
+                creds = self.get_db_reader().execute(SQL_SELECT_CREDS).fetchone()
             
             if creds:
                 # Re-initialize auth and start OAuth flow
-                self.auth = SchwabAuth(creds[1], creds[2], creds[3])
+                self.auth = SchwabAuth(
+                    creds["trading_client_id"],
+                    creds["trading_client_secret"],
+                    creds["redirect_uri"] or 'https://localhost:8443/callback'
+                )
                 self.start_oauth_flow()
             else:
                 # No credentials, show setup dialog
                 self.show_auth_dialog()
     
     def start_updates(self):
-        """Start background update thread."""
-        if not self.update_thread or not self.update_thread.is_alive():
-            self.stop_updates.clear()
-            self.update_thread = threading.Thread(target=self.update_worker, daemon=True)
-            self.update_thread.start()
-    
-    def update_worker(self):
-        """Background worker thread for periodic updates."""
+        """Start periodic updates, driven by Tk after() timers."""
+        if not self._updates_active:
+            self._updates_active = True
+            self._update_delay = self.preferences.get("refresh_interval", DEFAULT_REFRESH_INTERVAL)
+            self._schedule_update()
+            
+    def stop_updates(self):
+        """Cancel periodic updates."""
+        self._updates_active = False
+        if self._update_job is not None:
+            self.after_cancel(self._update_job)
+            self._update_job = None
+            
+    def _schedule_update(self):
+        """Arm the next periodic update."""
+        if self._updates_active and self._update_job is None:
+            self._update_job = self.after(int(self._update_delay * 1000), self._update_tick)
+        
+    def _update_tick(self):
+        """Start one periodic fetch on the I/O pool; the timer is re-armed when it finishes."""
+        self._update_job = None
+        if not (self.client and self.portfolio_manager):
+            self._schedule_update()
+            return
+            
+        portfolio_update = self._submit_portfolio_update()
+        future = self._io_pool.submit(self.update_worker, self.client, self.portfolio_manager, portfolio_update)
+        future.add_done_callback(lambda f: self._call_in_gui(self._on_update_done, f))
+        
+    def _on_update_done(self, future):
+        """Pick the next refresh delay: back off while nothing changes, reset when something does."""
         refresh_interval = self.preferences.get("refresh_interval", DEFAULT_REFRESH_INTERVAL)
+        changed = not future.cancelled() and future.exception() is None and future.result()
+        if changed:
+            self._update_delay = refresh_interval
+        else:
+            self._update_delay = min(self._update_delay * 2, max(refresh_interval, MAX_REFRESH_BACKOFF))
+        self._schedule_update()
         
-        while not self.stop_updates.is_set():
-            try:
-                if self.client and self.portfolio_manager:
-                    # Update portfolio in background
-                    self.portfolio_manager.update()
-                    
-                    # Queue UI updates
-                    self.update_queue.put({
-                        "type": "portfolio",
-                        "data": self.portfolio_manager.get_portfolio_summary()
-                    })
-                    
-                    # Get all positions from portfolio manager
-                    all_positions = []
-                    for account_num in self.portfolio_manager._positions:
-                        positions_dict = self.portfolio_manager._positions.get(account_num, {})
-                        for symbol, position in positions_dict.items():
-                            all_positions.append(position)
-                    
-                    self.update_queue.put({
-                        "type": "positions",
-                        "data": all_positions
-                    })
+    def _reset_update_backoff(self):
+        """Go back to the configured refresh interval, re-arming a backed-off timer."""
+        refresh_interval = self.preferences.get("refresh_interval", DEFAULT_REFRESH_INTERVAL)
+        if self._update_delay is None or self._update_delay == refresh_interval:
+            return
+        self._update_delay = refresh_interval
+        if self._update_job is not None:
+            self.after_cancel(self._update_job)
+            self._update_job = None
+            self._schedule_update()
+    
+    def update_worker(self, client, portfolio_manager, portfolio_update):
+        """Fetch portfolio, positions and quotes on the I/O pool and post them to the GUI.
+        
+        Args:
+            portfolio_update: Future of the portfolio_manager.update() call to wait for
+        
+        Returns:
+            True if the portfolio or any watched quote changed since the last fetch
+        """
+        changed = False
+        try:
+            # Wait for the shared portfolio fetch started by _update_tick
+            portfolio_update.result()
+            
+            # Queue UI updates
+            if self._take_portfolio_revision(portfolio_manager):
+                self._post_portfolio_updates(portfolio_manager)
+                changed = True
+            
+            # Update quotes for watched symbols
+            watched = self.watched_symbols
+            if watched:
+                try:
+                    # Get quotes for all watched symbols at once
+                    quotes_response = client.get_quotes(list(watched))
                     
-                    # Update quotes for watched symbols
-                    if self.watched_symbols:
-                        try:
-                            # Get quotes for all watched symbols at once
-                            quotes_response = self.client.get_quotes(list(self.watched_symbols))
-                            
-                            # Process each quote
-                            if hasattr(quotes_response, 'root') and quotes_response.root:
-                                for symbol, quote_data in quotes_response.root.items():
-                                    # The quote_data is a QuoteResponseObject with a root attribute
-                                    if hasattr(quote_data, 'root'):
-                                        actual_quote = quote_data.root
-                                        self.update_queue.put({
-                                            "type": "quote",
-                                            "data": {"symbol": symbol, "quote": actual_quote}
-                                        })
-                        except Exception as e:
-                            print(f"ERROR fetching quotes: {str(e)}")
-                            # Ignore datetime validation errors from the API
-                            if "datetime" in str(e) and "pattern" in str(e):
-                                pass
-                            else:
-                                pass
-                            
-            except Exception as e:
-                if "401" in str(e) or "unauthorized" in str(e).lower():
-                    # Authentication error - stop updates
-                    self.after(0, self.handle_auth_error)
-                    break
+                    # Parse every quote here so the GUI thread only applies numbers
+                    quotes = {}
+                    if hasattr(quotes_response, 'root') and quotes_response.root:
+                        for symbol, quote_data in quotes_response.root.items():
+                            # The quote_data is a QuoteResponseObject with a root attribute
+                            if hasattr(quote_data, 'root'):
+                                fields = self._extract_quote_fields(quote_data.root)
+                                if fields[0] > 0:
+                                    quotes[symbol] = fields
+                    if quotes:
+                        self._post_update({"type": "quotes", "data": quotes})
+                    if quotes != self._last_quotes:
+                        self._last_quotes = quotes
+                        changed = True
+                except Exception as e:
+                    print(f"ERROR fetching quotes: {str(e)}")
                     
-            # Wait for next update
-            self.stop_updates.wait(refresh_interval)
+        except Exception as e:
+            if "401" in str(e) or "unauthorized" in str(e).lower():
+                # Authentication error - stop updates
+                self._call_in_gui(self._on_update_auth_error)
+                
+        return changed
+                
+    def _take_portfolio_revision(self, portfolio_manager):
+        """Return True if portfolio_manager has data the views have not shown yet, marking it shown."""
+        current = (portfolio_manager, portfolio_manager.revision)
+        shown = self._shown_portfolio
+        if shown[0] is current[0] and shown[1] == current[1]:
+            return False
+        self._shown_portfolio = current
+        return True
+        
+    def _post_portfolio_updates(self, portfolio_manager):
+        """Queue portfolio summary and positions updates for the GUI thread."""
+        self._post_update({
+            "type": "portfolio",
+            "data": portfolio_manager.get_portfolio_summary()
+        })
+        
+        # Get all positions from portfolio manager
+        all_positions = self._all_positions(portfolio_manager)
+        
+        self._post_update({
+            "type": "positions",
+            "data": all_positions
+        })
+        
+    @staticmethod
+    def _all_positions(portfolio_manager):
+        """Return (account number, position) for every position from one snapshot of the per-account dicts."""
+        return [
+            (account_number, position)
+            for account_number, positions_dict in list(portfolio_manager._positions.items())
+            for position in positions_dict.values()
+        ]
+        
+    def _on_update_auth_error(self):
+        """Stop periodic updates and prompt for re-authentication."""
+        self.stop_updates()
+        self.handle_auth_error()
+        
+    def set_accounts(self, accounts):
+        """Store the linked accounts and their masked "*1234" labels."""
+        self.account_data = [(acc.account_number, acc.hash_value) for acc in accounts]
+        self.accounts = [acc.hash_value for acc in accounts]  # Use hash values for API calls
+        self.account_labels = {acc_hash: f"*{number[-4:]}" for number, acc_hash in self.account_data}
+        self.account_by_label = {label: acc_hash for acc_hash, label in self.account_labels.items()}
         
     def on_account_change(self, account):
         """Handle account selection change."""
@@ -3076,16 +3556,29 @@ A professional-grade trading interface for Charles Schwab.
     def add_to_watchlist(self):
         """Add symbol to watchlist."""
         symbol = self.symbol_entry.get().upper()
-        if symbol and symbol not in self.watched_symbols:
-            self.watched_symbols.add(symbol)
+        if symbol and self.add_watched_symbol(symbol):
             self.watchlist.add_symbol(symbol, 100.0, 2.5, 2.45)  # Dummy data
             self.symbol_entry.delete(0, tk.END)
             ToastNotification.show_toast(self, f"Added {symbol} to watchlist", "success")
             
+    def add_watched_symbol(self, symbol):
+        """Add a symbol to the watched set; returns False if it was already there."""
+        symbol = sys.intern(symbol)
+        with self._watched_lock:
+            if symbol in self.watched_symbols:
+                return False
+            self.watched_symbols = self.watched_symbols | {symbol}
+        return True
+        
+    def remove_watched_symbol(self, symbol):
+        """Stop fetching quotes for a symbol removed from the watchlist."""
+        with self._watched_lock:
+            self.watched_symbols = self.watched_symbols - {symbol}
+        
     def on_watchlist_symbol_click(self, symbol):
         """Handle watchlist symbol click."""
+        self.show_tab("📉 Charts")
         self.chart_symbol_var.set(symbol)
-        self.tab_view.set("📉 Charts")
         
     def quick_quote(self):
         """Show quick quote dialog."""
@@ -3112,14 +3605,45 @@ A professional-grade trading interface for Charles Schwab.
         export_menu.tk_popup(self.winfo_pointerx(), self.winfo_pointery())
         
     def export_to_csv(self):
-        """Export data to CSV."""
+        """Export current positions to CSV."""
+        if not self.portfolio_manager:
+            self.show_warning("Not connected to Schwab")
+            return
+            
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
-        if filename:
-            # Export implementation would go here
-            ToastNotification.show_toast(self, f"Exported to {os.path.basename(filename)}", "success")
+        if not filename:
+            return
+            
+        accounts = self.account_labels
+        fmt = "{:.2f}".format
+        
+        # Snapshot the position dicts; pool refreshes replace them in place
+        rows = (
+            (
+                accounts.get(account, account),
+                symbol,
+                (position.long_quantity or 0) - (position.short_quantity or 0),
+                fmt(position.average_price or 0),
+                fmt(position.market_value or 0),
+                fmt(position.current_day_profit_loss or 0)
+            )
+            for account, positions in list(self.portfolio_manager._positions.items())
+            for symbol, position in list(positions.items())
+        )
+        
+        try:
+            with open(filename, "w", newline="", buffering=1 << 16) as f:
+                writer = csv.writer(f)
+                writer.writerow(("Account", "Symbol", "Quantity", "Avg Price", "Market Value", "Day P&L"))
+                writer.writerows(rows)
+        except OSError as e:
+            self.show_error(f"Export failed: {str(e)}")
+            return
+            
+        ToastNotification.show_toast(self, f"Exported to {os.path.basename(filename)}", "success")
             
     def export_to_excel(self):
         """Export data to Excel."""
@@ -3217,26 +3741,11 @@ A professional-grade trading interface for Charles Schwab.
             columns: List of column names
             column_widths: Dict of column name to width, or None for defaults
         """
-        default_widths = {
-            "P&L": 100,
-            "P&L %": 100,
-            "Day Change": 100,
-            "Order ID": 120,
-            "Status": 80,
-            "Type": 80,
-            "Price": 80,
-            "Quantity": 80
-        }
+        widths = {**COLUMN_WIDTHS, **column_widths} if column_widths else COLUMN_WIDTHS
         
         for col in columns:
             treeview.heading(col, text=col)
-            if column_widths and col in column_widths:
-                width = column_widths[col]
-            elif col in default_widths:
-                width = default_widths[col]
-            else:
-                width = 120  # Default width
-            treeview.column(col, width=width)
+            treeview.column(col, width=widths.get(col, DEFAULT_COLUMN_WIDTH))
         
     def refresh_portfolio(self):
         """Refresh portfolio data."""
@@ -3295,8 +3804,8 @@ A professional-grade trading interface for Charles Schwab.
             values = item['values']
             if values:
                 symbol = values[0]  # Symbol is first column
+                self.show_tab("📉 Charts")
                 self.chart_symbol_var.set(symbol)
-                self.tab_view.set("📉 Charts")
     
     def on_position_double_click(self, event):
         """Handle double-click on position - open order to close position."""
@@ -3320,13 +3829,10 @@ A professional-grade trading interface for Charles Schwab.
             return
             
         symbol = values[0]  # Symbol is first column
-        quantity = values[1]  # Quantity is second column
         
-        # Parse quantity (remove commas)
-        try:
-            qty = float(str(quantity).replace(',', ''))
-        except:
-            qty = 0
+        # Numeric quantity; the Quantity column is formatted and rounded
+        state = self._position_state.get(selection[0])
+        qty = state['quantity'] if state else 0
             
         if qty <= 0:
             self.show_error("Invalid position quantity")
@@ -3405,7 +3911,7 @@ A professional-grade trading interface for Charles Schwab.
         ctk.CTkLabel(
             main_frame,
             text="Place Order",
-            font=("Roboto", 20, "bold")
+            font=FONT_METRIC
         ).pack(pady=(0, 20))
         
         # Account selection
@@ -3413,7 +3919,7 @@ A professional-grade trading interface for Charles Schwab.
         account_var = ctk.StringVar(value=self.account_var.get())
         account_menu = ctk.CTkOptionMenu(
             main_frame,
-            values=[f"*{acc[0][-4:]}" for acc in self.account_data],
+            values=list(self.account_labels.values()),
             variable=account_var
         )
         account_menu.pack(fill="x", pady=(0, 10))
@@ -3512,7 +4018,7 @@ A professional-grade trading interface for Charles Schwab.
                 
                 # Get account hash
                 account_display = account_var.get()
-                account_hash = next((acc[1] for acc in self.account_data if f"*{acc[0][-4:]}" == account_display), None)
+                account_hash = self.account_by_label.get(account_display)
                 
                 if not account_hash:
                     messagebox.showerror("Error", "Invalid account selection")
@@ -3521,30 +4027,10 @@ A professional-grade trading interface for Charles Schwab.
                 # Build order based on type
                 order_type = order_type_var.get()
                 
-                # Import order types
-                from schwab.models.orders import OrderType as OT, Session, Duration, Instruction
-                
-                # Map string values to enums
-                order_type_map = {
-                    "MARKET": OT.MARKET,
-                    "LIMIT": OT.LIMIT,
-                    "STOP": OT.STOP,
-                    "STOP_LIMIT": OT.STOP_LIMIT
-                }
-                
-                duration_map = {
-                    "DAY": Duration.DAY,
-                    "GTC": Duration.GOOD_TILL_CANCEL,
-                    "IOC": Duration.IMMEDIATE_OR_CANCEL,
-                    "FOK": Duration.FILL_OR_KILL
-                }
-                
-                instruction_map = {
-                    "BUY": Instruction.BUY,
-                    "SELL": Instruction.SELL,
-                    "BUY_TO_COVER": Instruction.BUY_TO_COVER,
-                    "SELL_SHORT": Instruction.SELL_SHORT
-                }
+                # Order enum lookup tables (built once)
+                models = _get_order_models()
+                duration_map = models.durations
+                instruction_map = models.instructions
                 
                 # Create order
                 if order_type == "MARKET":
@@ -3621,7 +4107,33 @@ A professional-grade trading interface for Charles Schwab.
         
     def cancel_selected_order(self):
         """Cancel selected order."""
-        pass
+        selection = self.orders_tree.selection()
+        if not selection:
+            self.show_warning("Please select an order first")
+            return
+            
+        # Rows are keyed by order id; the account comes from the fetch, not the "*1234" label
+        order_id = selection[0]
+        account_hash = self._order_accounts.get(order_id)
+        if not self.client or not account_hash:
+            self.show_warning("Not connected to Schwab")
+            return
+            
+        if not messagebox.askyesno("Cancel Order", f"Cancel order {order_id}?"):
+            return
+            
+        future = self._io_pool.submit(self.client.cancel_order, account_hash, int(order_id))
+        future.add_done_callback(lambda f: self._call_in_gui(self._on_order_cancelled, order_id, f))
+        
+    def _on_order_cancelled(self, order_id, future):
+        """Report the result of cancel_selected_order (runs on the Tk thread)."""
+        error = future.exception()
+        if error is not None:
+            self.show_error(f"Failed to cancel order {order_id}: {str(error)}")
+            return
+            
+        self.show_success(f"Order {order_id} cancelled")
+        self.refresh_orders()
         
     def modify_selected_order(self):
         """Modify selected order."""
@@ -3650,7 +4162,6 @@ A professional-grade trading interface for Charles Schwab.
         self._loading_chart = True
         
         # Add call stack trace to debug multiple calls
-        import traceback
         chart_logger.info(f"Starting to load chart data for symbol: {symbol}")
         chart_logger.debug(f"Called from: {''.join(traceback.format_stack()[-3:-1])}")
         
@@ -3693,8 +4204,7 @@ A professional-grade trading interface for Charles Schwab.
                             self._generate_historical_data(self.timeframe_var.get())
                             
                             # Add to watchlist if not already there
-                            if symbol not in self.watched_symbols:
-                                self.watched_symbols.add(symbol)
+                            if self.add_watched_symbol(symbol):
                                 self.watchlist.add_symbol(symbol, price, 0, 0)
                         else:
                             chart_logger.warning(f"No price data found for {symbol}")
@@ -3707,8 +4217,7 @@ A professional-grade trading interface for Charles Schwab.
                 chart_logger.error(f"Error details: {e.__dict__}")
             
             # Add full stack trace
-            import traceback
-            chart_logger.error(f"Full stack trace:\n{traceback.format_exc()}")
+            chart_logger.error(f"Full stack trace:\n{_format_exc()}")
             
             ToastNotification.show_toast(self, f"Error loading data: {str(e)}", "error")
         finally:
@@ -3869,8 +4378,7 @@ A professional-grade trading interface for Charles Schwab.
             chart_logger.error(f"Error type in _generate_historical_data: {type(e).__name__}")
             
             # Add full stack trace
-            import traceback
-            chart_logger.error(f"Stack trace from _generate_historical_data:\n{traceback.format_exc()}")
+            chart_logger.error(f"Stack trace from _generate_historical_data:\n{_format_exc()}")
             
             ToastNotification.show_toast(
                 self, 
@@ -3911,10 +4419,10 @@ A professional-grade trading interface for Charles Schwab.
                         options_value += float(pos_data.get('market_value', 0))
                 
                 # Update labels
-                self.portfolio_labels['cash'].configure(text=f"${total_cash:,.2f}")
-                self.portfolio_labels['securities'].configure(text=f"${total_equity:,.2f}")
-                self.portfolio_labels['options'].configure(text=f"${options_value:,.2f}")
-                self.portfolio_labels['total'].configure(text=f"${total_value:,.2f}")
+                self.set_portfolio_label('cash', f"${total_cash:,.2f}")
+                self.set_portfolio_label('securities', f"${total_equity:,.2f}")
+                self.set_portfolio_label('options', f"${options_value:,.2f}")
+                self.set_portfolio_label('total', f"${total_value:,.2f}")
             
             # Calculate additional metrics
             total_value = float(summary.get('total_value', 0))
@@ -3975,22 +4483,37 @@ A professional-grade trading interface for Charles Schwab.
             pass
     
     def update_allocation_chart(self, allocations):
-        """Update the allocation pie chart."""
+        """Update the allocation pie chart.
+        
+        When the asset types are unchanged the existing wedges and texts are
+        moved in place; the axes are only rebuilt when the slice set changes.
+        """
         if not allocations:
             return
             
-        self.allocation_ax.clear()
-        
         # Prepare data
+        asset_types = []
         labels = []
         sizes = []
         colors = ['#00ff88', '#00aaff', '#ffaa00', '#ff4444', '#aa00ff']
         
         for asset_type, value in allocations.items():
             if value > 0:
+                asset_types.append(asset_type)
                 labels.append(f"{asset_type}\n${value:,.0f}")
                 sizes.append(value)
         
+        pie = self._allocation_pie
+        if pie is not None and pie[0] == asset_types:
+            if pie[1] != sizes:
+                self._update_pie_artists(pie, labels, sizes)
+                self._allocation_pie = (asset_types, sizes) + pie[2:]
+                self.allocation_canvas.draw_idle()
+            return
+            
+        self.allocation_ax.clear()
+        self._allocation_pie = None
+        
         if sizes:
             # Create pie chart
             wedges, texts, autotexts = self.allocation_ax.pie(
@@ -4008,40 +4531,54 @@ A professional-grade trading interface for Charles Schwab.
                 autotext.set_color('white')
                 autotext.set_weight('bold')
                 
+            self._allocation_pie = (asset_types, sizes, wedges, texts, autotexts)
+                
         self.allocation_ax.set_title('Portfolio Allocation', color='white', fontsize=14)
-        self.allocation_canvas.draw()
+        self.allocation_canvas.draw_idle()
         
+    @staticmethod
+    def _update_pie_artists(pie, labels, sizes):
+        """Resize the wedges of a pie drawn with startangle=90 and move its texts to match."""
+        _, _, wedges, texts, autotexts = pie
+        total = sum(sizes)
+        theta1 = 90.0
+        for wedge, text, autotext, label, size in zip(wedges, texts, autotexts, labels, sizes):
+            theta2 = theta1 + 360.0 * size / total
+            wedge.set_theta1(theta1)
+            wedge.set_theta2(theta2)
+            
+            # Same placement as Axes.pie: labels at 1.1 radii, percentages at 0.6
+            mid = math.radians((theta1 + theta2) / 2)
+            cos_mid, sin_mid = math.cos(mid), math.sin(mid)
+            text.set_position((1.1 * cos_mid, 1.1 * sin_mid))
+            text.set_horizontalalignment('left' if cos_mid > 0 else 'right')
+            text.set_text(label)
+            autotext.set_position((0.6 * cos_mid, 0.6 * sin_mid))
+            autotext.set_text(f"{100.0 * size / total:1.1f}%")
+            theta1 = theta2
+            
     def update_positions_display(self, data=None):
         """Update positions display."""
         if not self.portfolio_manager:
             return
             
         try:
-            
-            # Clear existing items
-            for item in self.positions_tree.get_children():
-                self.positions_tree.delete(item)
-            
             # Get all positions
             if data is not None:
                 positions = data if isinstance(data, list) else []
             else:
-                positions = []
-                for account_num in self.portfolio_manager._positions:
-                    positions_dict = self.portfolio_manager._positions.get(account_num, {})
-                    for symbol, position in positions_dict.items():
-                        positions.append(position)
-            
-            displayed_count = 0
-            for position in positions:
+                positions = self._all_positions(self.portfolio_manager)
+            
+            # Rows keyed by account and symbol, since a symbol may be held in
+            # several accounts; only changed rows are pushed to the tree
+            rows = {}
+            position_state = {}
+            for account_number, position in positions:
                 # Extract symbol
                 symbol = self._extract_symbol_from_position(position)
                 if not symbol:
                     continue
                 
-                # Debug: Log position attributes
-                position_attrs = [attr for attr in dir(position) if not attr.startswith('_')]
-                
                 # Get position details
                 long_qty = getattr(position, 'long_quantity', 0)
                 short_qty = getattr(position, 'short_quantity', 0)
@@ -4051,22 +4588,21 @@ A professional-grade trading interface for Charles Schwab.
                     continue
                     
                     
-                # Calculate values
-                market_value = getattr(position, 'market_value', 0)
-                average_price = getattr(position, 'average_price', 0)
+                # Calculate values (convert Decimal fields to float once)
+                quantity = float(quantity)
+                market_value = float(getattr(position, 'market_value', 0) or 0)
+                average_price = float(getattr(position, 'average_price', 0) or 0)
                 
                 # Get current price from market value and quantity
-                current_price = float(market_value) / float(quantity) if quantity != 0 else 0
+                current_price = market_value / quantity
                 
                 # Calculate P&L
-                cost_basis = float(average_price) * float(quantity)
-                pnl = float(market_value) - cost_basis
+                cost_basis = average_price * quantity
+                pnl = market_value - cost_basis
                 pnl_pct = (pnl / cost_basis) * 100 if cost_basis > 0 else 0
                 
                 # Day change (if available)
-                day_change = 0
-                if hasattr(position, 'current_day_profit_loss'):
-                    day_change = float(getattr(position, 'current_day_profit_loss', 0))
+                day_change = float(getattr(position, 'current_day_profit_loss', 0) or 0)
                 
                 # Format values
                 values = (
@@ -4081,28 +4617,22 @@ A professional-grade trading interface for Charles Schwab.
                 )
                 
                 # Determine tag for coloring
-                tags = ()
-                if pnl >= 0:
-                    tags = ("gain",)
-                else:
-                    tags = ("loss",)
+                tags = ("gain",) if pnl >= 0 else ("loss",)
                     
-                # Insert item
-                self.positions_tree.insert("", "end", values=values, tags=tags)
-                displayed_count += 1
-            
+                row_id = f"{account_number}:{symbol}"
+                rows[row_id] = (values, tags)
+                position_state[row_id] = {'quantity': quantity, 'avg_cost': average_price}
             
             # Debug: Add a test row if no positions were displayed
-            if displayed_count == 0 and len(positions) > 0:
+            if not rows and len(positions) > 0:
                 test_values = ("TEST", "100", "$10.00", "$12.00", "$1,200.00", "$200.00", "20.00%", "$50.00")
-                self.positions_tree.insert("", "end", values=test_values, tags=("gain",))
+                rows["TEST"] = (test_values, ("gain",))
             
-            # Configure tags
-            self.positions_tree.tag_configure("gain", foreground="#00ff88")
-            self.positions_tree.tag_configure("loss", foreground="#ff4444")
+            self._position_state = position_state
+            self.positions_tree.sync_rows(rows)
             
         except Exception as e:
-            import traceback
+            pass
     
     def _extract_symbol_from_position(self, position) -> str:
         """Extract symbol from position object."""
@@ -4119,37 +4649,60 @@ A professional-grade trading interface for Charles Schwab.
             return ""
             
     def refresh_orders(self):
-        """Refresh orders display."""
+        """Fetch orders for all accounts on the I/O pool, then redisplay them."""
         if not self.client:
             return
             
+        client = self.client
+        # Every account is queried with the same window ending now
+        to_date = datetime.now()
+        from_date = to_date - ORDERS_LOOKBACK
+        
+        def fetch(account_hash):
+            orders = client.get_orders(
+                account_number=account_hash,
+                from_entered_time=from_date,
+                to_entered_time=to_date
+            )
+            for order in orders:
+                # Add account info to order
+                order.account_hash = account_hash
+            return orders
+        
+        futures = [self._io_pool.submit(fetch, account_hash) for account_hash in self.accounts]
+        self._orders_futures = futures
+        if not futures:
+            self._populate_orders_tree(futures)
+            return
+            
+        # Hand the batch back to the Tk thread once every account has answered
+        remaining = [len(futures)]
+        lock = threading.Lock()
+        
+        def on_done(_):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            self._call_in_gui(self._populate_orders_tree, futures)
+            
+        for future in futures:
+            future.add_done_callback(on_done)
+            
+    def _populate_orders_tree(self, futures):
+        """Display the orders fetched by refresh_orders (runs on the Tk thread)."""
+        if futures is not self._orders_futures:
+            return  # Superseded by a newer refresh
+            
         try:
             # Get current filter
             filter_value = self.order_filter_var.get()
             
-            # Clear existing items
-            for item in self.orders_tree.get_children():
-                self.orders_tree.delete(item)
-                
-            # Get orders for all accounts
+            # Collect orders, skipping accounts whose fetch failed
             all_orders = []
-            # Get orders from the last 7 days
-            from_date = datetime.now() - timedelta(days=7)
-            to_date = datetime.now()
-            
-            for account_hash in self.accounts:
-                try:
-                    orders = self.client.get_orders(
-                        account_number=account_hash,
-                        from_entered_time=from_date,
-                        to_entered_time=to_date
-                    )
-                    for order in orders:
-                        # Add account info to order
-                        order.account_hash = account_hash
-                        all_orders.append(order)
-                except Exception as e:
-                    pass
+            for future in futures:
+                if not future.cancelled() and future.exception() is None:
+                    all_orders.extend(future.result())
             
             # Filter orders
             filtered_orders = []
@@ -4165,30 +4718,34 @@ A professional-grade trading interface for Charles Schwab.
                 elif filter_value == "Rejected" and order.status == "REJECTED":
                     filtered_orders.append(order)
                     
-            # Display filtered orders
+            # Rows keyed by order id; only changed rows are pushed to the tree
+            account_labels = self.account_labels
+            rows = {}
+            order_accounts = {}
             for order in filtered_orders:
                 # Extract order details
                 symbol = ""
                 quantity = 0
                 price = ""
                 
-                if hasattr(order, 'order_leg_collection') and order.order_leg_collection:
+                # Order is a pydantic model, so every field exists (possibly None)
+                if order.order_leg_collection:
                     leg = order.order_leg_collection[0]
                     symbol = leg.instrument.symbol
                     quantity = leg.quantity
                     
-                    if hasattr(leg, 'order_leg_type'):
-                        if order.order_type == "LIMIT":
-                            price = f"${order.price:.2f}"
-                        elif order.order_type == "STOP":
-                            price = f"Stop ${order.stop_price:.2f}"
-                        elif order.order_type == "STOP_LIMIT":
-                            price = f"Stop ${order.stop_price:.2f} Limit ${order.price:.2f}"
-                        else:
-                            price = "Market"
+                    if order.order_type == "LIMIT":
+                        price = f"${order.price:.2f}"
+                    elif order.order_type == "STOP":
+                        price = f"Stop ${order.stop_price:.2f}"
+                    elif order.order_type == "STOP_LIMIT":
+                        price = f"Stop ${order.stop_price:.2f} Limit ${order.price:.2f}"
+                    else:
+                        price = "Market"
                 
                 # Get account display
-                account_display = f"*{next((acc[0][-4:] for acc in self.account_data if acc[1] == order.account_hash), 'Unknown')}"
+                account_display = account_labels.get(order.account_hash, "*Unknown")
+                entered_time = order.entered_time
                 
                 values = (
                     order.order_id,
@@ -4197,7 +4754,7 @@ A professional-grade trading interface for Charles Schwab.
                     quantity,
                     price,
                     order.status,
-                    order.entered_time.strftime("%m/%d %H:%M") if hasattr(order, 'entered_time') else "",
+                    format_order_time(entered_time) if entered_time else "",
                     account_display
                 )
                 
@@ -4210,13 +4767,12 @@ A professional-grade trading interface for Charles Schwab.
                 elif order.status in ["QUEUED", "ACCEPTED", "WORKING"]:
                     tags = ("open",)
                     
-                # Insert item
-                self.orders_tree.insert("", "end", values=values, tags=tags)
+                iid = str(order.order_id)
+                rows[iid] = (values, tags)
+                order_accounts[iid] = order.account_hash
             
-            # Configure tags
-            self.orders_tree.tag_configure("filled", foreground="#00ff88")
-            self.orders_tree.tag_configure("cancelled", foreground="#ff4444")
-            self.orders_tree.tag_configure("open", foreground="#00aaff")
+            self._order_accounts = order_accounts
+            self.orders_tree.sync_rows(rows)
             
         except Exception as e:
             pass
@@ -4225,17 +4781,9 @@ A professional-grade trading interface for Charles Schwab.
         """Update orders display from queue data."""
         self.refresh_orders()
         
-    def update_quote_display(self, data):
-        """Update quote display for a symbol."""
-        if not data:
-            return
-            
-        symbol = data.get("symbol")
-        quote = data.get("quote")
-        
-        if not symbol or not quote:
-            return
-            
+    @staticmethod
+    def _extract_quote_fields(quote):
+        """Return (price, change, change_pct) from a quote response object or dict."""
         try:
             # Extract quote data - the structure depends on the API response
             price = 0
@@ -4264,13 +4812,27 @@ A professional-grade trading interface for Charles Schwab.
                 price = getattr(quote, 'last', 0) or getattr(quote, 'lastPrice', 0)
                 change = getattr(quote, 'netChange', 0)
                 change_pct = getattr(quote, 'percentChange', 0)
+                
+            return price or 0, change or 0, change_pct or 0
             
-            if price > 0:
+        except Exception as e:
+            return 0, 0, 0
+            
+    def update_quote_display(self, quotes):
+        """Apply parsed quotes to the watchlist, price history and chart.
+        
+        Args:
+            quotes: Dict of symbol -> (price, change, change_pct)
+        """
+        current_time = datetime.now()
+        chart_symbol = self.chart_symbol_var.get() if hasattr(self, 'chart_symbol_var') else None
+        
+        for symbol, (price, change, change_pct) in quotes.items():
+            try:
                 # Update watchlist
                 self.watchlist.update_symbol(symbol, price, change_pct, change)
                 
                 # Store price history
-                current_time = datetime.now()
                 if symbol not in self.price_history:
                     self.price_history[symbol] = []
                 
@@ -4282,11 +4844,11 @@ A professional-grade trading interface for Charles Schwab.
                     self.price_history[symbol] = self.price_history[symbol][-1000:]
                 
                 # Update chart if this is the selected symbol
-                if hasattr(self, 'chart_symbol_var') and self.chart_symbol_var.get() == symbol:
+                if chart_symbol == symbol:
                     self.main_chart.update_chart(symbol, current_time, price)
                     
-        except Exception as e:
-            pass
+            except Exception as e:
+                pass
 
 
 def main():
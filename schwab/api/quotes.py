@@ -1,19 +1,89 @@
 from typing import List, Optional, Union, Dict, Any
 from datetime import datetime
+import asyncio
+import copy
+import inspect
 import re
 from ..models.quotes import QuoteResponse
+from ..cache import InMemoryTTLCache, RESPONSE_CACHE_TTLS
+
+# Maximum number of symbols sent in one quotes request by the bulk helpers
+QUOTES_CHUNK_SIZE = 500
 
 class QuotesMixin:
     """Mixin class providing quote-related API methods"""
     
+    # How the client issues GETs; resolved once per subclass
+    _has_make_request = False
+    _async_requests = False
+    # Clients set this from their cache_responses argument
+    cache_responses = True
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._has_make_request = hasattr(cls, '_make_request')
+        cls._async_requests = inspect.iscoroutinefunction(getattr(cls, '_make_request', None))
+    
+    def _market_data_get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """GET a market data endpoint through the client's request method."""
+        if self._has_make_request:
+            return self._make_request("GET", endpoint, params=params)
+        return self._get(endpoint, params=params)
+    
+    def _get_response_cache(self) -> InMemoryTTLCache:
+        """Return this client's market data response cache, creating it on first use."""
+        cache = getattr(self, '_response_cache', None)
+        if cache is None:
+            cache = self._response_cache = InMemoryTTLCache()
+        return cache
+    
+    @staticmethod
+    def _response_cache_key(endpoint: str, params: Optional[Dict[str, Any]]) -> tuple:
+        """Build a cache key from the endpoint and its query parameters."""
+        return (endpoint, tuple(sorted(params.items())) if params else ())
+    
+    def _cached_get(self, kind: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                    use_cache: bool = True) -> Dict[str, Any]:
+        """GET a market data endpoint, reusing a response younger than the TTL for kind.
+        
+        Callers get a deep copy, so editing a result never changes what later
+        callers see. On async clients this returns a coroutine that caches the
+        awaited response the same way. With use_cache=False, or on a client
+        created with cache_responses=False, the endpoint is always fetched.
+        """
+        if not (use_cache and self.cache_responses):
+            return self._market_data_get(endpoint, params)
+        if self._async_requests:
+            return self._async_cached_get(kind, endpoint, params)
+        cache = self._get_response_cache()
+        key = self._response_cache_key(endpoint, params)
+        response = cache.get(key)
+        if response is None:
+            response = self._market_data_get(endpoint, params)
+            cache.set(key, response, RESPONSE_CACHE_TTLS[kind])
+        return copy.deepcopy(response)
+    
+    async def _async_cached_get(self, kind: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                                use_cache: bool = True) -> Dict[str, Any]:
+        """Async counterpart of _cached_get for clients whose _make_request is a coroutine."""
+        if not (use_cache and self.cache_responses):
+            return await self._market_data_get(endpoint, params)
+        cache = self._get_response_cache()
+        key = self._response_cache_key(endpoint, params)
+        response = cache.get(key)
+        if response is None:
+            response = await self._market_data_get(endpoint, params)
+            cache.set(key, response, RESPONSE_CACHE_TTLS[kind])
+        return copy.deepcopy(response)
+    
     def _clean_datetime_values(self, data: Any) -> Any:
         """Recursively clean datetime values in response data.
         
         Converts datetime objects and strings to the format expected by the models.
+        Containers are copied only when something inside them changes, so a
+        plain JSON payload is returned as-is.
         """
-        from datetime import datetime as dt
-        
-        if isinstance(data, dt):
+        if isinstance(data, datetime):
             # Handle datetime objects at any level first
             # Convert to ISO format with Z suffix for UTC
             if data.tzinfo:
@@ -33,13 +103,26 @@ class QuotesMixin:
             else:
                 return data.isoformat() + 'Z'
         elif isinstance(data, dict):
-            cleaned = {}
+            cleaned = None
             for key, value in data.items():
-                # Always clean the value recursively
-                cleaned[key] = self._clean_datetime_values(value)
-            return cleaned
+                # Scalars other than datetime never change, so skip the recursive call
+                if isinstance(value, (dict, list, datetime)):
+                    new_value = self._clean_datetime_values(value)
+                    if new_value is not value:
+                        if cleaned is None:
+                            cleaned = dict(data)
+                        cleaned[key] = new_value
+            return data if cleaned is None else cleaned
         elif isinstance(data, list):
-            return [self._clean_datetime_values(item) for item in data]
+            cleaned = None
+            for index, item in enumerate(data):
+                if isinstance(item, (dict, list, datetime)):
+                    new_item = self._clean_datetime_values(item)
+                    if new_item is not item:
+                        if cleaned is None:
+                            cleaned = list(data)
+                        cleaned[index] = new_item
+            return data if cleaned is None else cleaned
         else:
             return data
     
@@ -47,20 +130,23 @@ class QuotesMixin:
                            indicative: Optional[bool] = None) -> Dict[str, Any]:
         """Build the parameters for the quotes endpoint"""
         if isinstance(symbols, list):
-            symbols = ','.join(symbols)
+            # Deduplicate and sort so equal symbol sets share one cache key
+            symbols = ','.join(sorted(set(symbols)))
             
         params = {"symbols": symbols}
         
         if fields:
             params["fields"] = ','.join(fields)
         if indicative is not None:
-            params["indicative"] = indicative
+            # The API expects lowercase booleans, and aiohttp rejects bool query values
+            params["indicative"] = str(indicative).lower()
             
         return params
 
     def get_quotes(self, symbols: Union[str, List[str]], 
                   fields: Optional[List[str]] = None,
-                  indicative: Optional[bool] = None) -> QuoteResponse:
+                  indicative: Optional[bool] = None,
+                  use_cache: bool = True) -> QuoteResponse:
         """
         Get quotes for one or more symbols.
         
@@ -69,6 +155,7 @@ class QuotesMixin:
             fields: Optional list of data fields to include. Available values:
                    ['quote', 'fundamental', 'extended', 'reference', 'regular']
             indicative: Include indicative symbol quotes for ETF symbols
+            use_cache: Reuse a response from the last few seconds; pass False for fresh quotes
         
         Returns:
             QuoteResponse object containing quote data for requested symbols
@@ -76,7 +163,7 @@ class QuotesMixin:
         params = self._build_quote_params(symbols, fields, indicative)
         
         # We're in sync context (get_quotes is not async)
-        response = self._get("/marketdata/v1/quotes", params=params)
+        response = self._cached_get("quotes", "/marketdata/v1/quotes", params, use_cache)
         
         # Clean datetime values before parsing  
         cleaned_response = self._clean_datetime_values(response)
@@ -109,7 +196,8 @@ class QuotesMixin:
 
     async def async_get_quotes(self, symbols: Union[str, List[str]], 
                              fields: Optional[List[str]] = None,
-                             indicative: Optional[bool] = None) -> QuoteResponse:
+                             indicative: Optional[bool] = None,
+                             use_cache: bool = True) -> QuoteResponse:
         """
         Get quotes for one or more symbols asynchronously.
         
@@ -118,12 +206,13 @@ class QuotesMixin:
             fields: Optional list of data fields to include. Available values:
                    ['quote', 'fundamental', 'extended', 'reference', 'regular']
             indicative: Include indicative symbol quotes for ETF symbols
+            use_cache: Reuse a response from the last few seconds; pass False for fresh quotes
         
         Returns:
             QuoteResponse object containing quote data for requested symbols
         """
         params = self._build_quote_params(symbols, fields, indicative)
-        response = await self._async_get("/marketdata/v1/quotes", params=params)
+        response = await self._async_cached_get("quotes", "/marketdata/v1/quotes", params, use_cache)
         # Clean datetime values before parsing
         cleaned_response = self._clean_datetime_values(response)
         
@@ -153,6 +242,66 @@ class QuotesMixin:
             else:
                 raise
     
+    @staticmethod
+    def _chunk_symbols(symbols: List[str], chunk_size: int) -> List[List[str]]:
+        """Split a deduplicated, sorted symbol list into request-sized chunks."""
+        unique = sorted(set(symbols))
+        return [unique[i:i + chunk_size] for i in range(0, len(unique), chunk_size)]
+    
+    @staticmethod
+    def _merge_quote_responses(responses: List[QuoteResponse]) -> QuoteResponse:
+        """Combine per-chunk quote responses into a single response."""
+        merged = {}
+        for response in responses:
+            if response.root:
+                merged.update(response.root)
+        return QuoteResponse(merged)
+    
+    def get_quotes_bulk(self, symbols: List[str], chunk_size: int = QUOTES_CHUNK_SIZE,
+                        fields: Optional[List[str]] = None,
+                        indicative: Optional[bool] = None,
+                        use_cache: bool = True) -> QuoteResponse:
+        """
+        Get quotes for a large symbol list, one request per chunk of symbols.
+        
+        Args:
+            symbols: List of symbol strings; duplicates are dropped
+            chunk_size: Maximum number of symbols per request
+            fields: Optional list of data fields to include
+            indicative: Include indicative symbol quotes for ETF symbols
+            use_cache: Reuse responses from the last few seconds; pass False for fresh quotes
+        
+        Returns:
+            QuoteResponse object containing quote data for all requested symbols
+        """
+        return self._merge_quote_responses([
+            self.get_quotes(chunk, fields, indicative, use_cache)
+            for chunk in self._chunk_symbols(symbols, chunk_size)
+        ])
+    
+    async def async_get_quotes_bulk(self, symbols: List[str], chunk_size: int = QUOTES_CHUNK_SIZE,
+                                    fields: Optional[List[str]] = None,
+                                    indicative: Optional[bool] = None,
+                                    use_cache: bool = True) -> QuoteResponse:
+        """
+        Get quotes for a large symbol list asynchronously, requesting all chunks concurrently.
+        
+        Args:
+            symbols: List of symbol strings; duplicates are dropped
+            chunk_size: Maximum number of symbols per request
+            fields: Optional list of data fields to include
+            indicative: Include indicative symbol quotes for ETF symbols
+            use_cache: Reuse responses from the last few seconds; pass False for fresh quotes
+        
+        Returns:
+            QuoteResponse object containing quote data for all requested symbols
+        """
+        responses = await asyncio.gather(*(
+            self.async_get_quotes(chunk, fields, indicative, use_cache)
+            for chunk in self._chunk_symbols(symbols, chunk_size)
+        ))
+        return self._merge_quote_responses(responses)
+    
     # Price History Methods
     def get_price_history(
         self,
@@ -188,8 +337,8 @@ class QuotesMixin:
             "period": period,
             "frequencyType": frequency_type,
             "frequency": frequency,
-            "needExtendedHoursData": need_extended_hours_data,
-            "needPreviousClose": need_previous_close
+            "needExtendedHoursData": str(need_extended_hours_data).lower(),
+            "needPreviousClose": str(need_previous_close).lower()
         }
         
         if start_date:
@@ -198,16 +347,11 @@ class QuotesMixin:
             params["endDate"] = int(end_date.timestamp() * 1000)
             
         try:
-            if hasattr(self, '_make_request'):
-                response = self._make_request("GET", "/marketdata/v1/pricehistory", params=params)
-            else:
-                response = self._get("/marketdata/v1/pricehistory", params=params)
-            return response
+            return self._cached_get("price_history", "/marketdata/v1/pricehistory", params)
         except Exception as e:
             # Check if this is a datetime validation error
             if "datetime" in str(e) and "pattern" in str(e):
                 # Re-raise with additional context
-                import traceback
                 raise Exception(f"Datetime format issue from API: {str(e)}") from e
             raise
     
@@ -229,10 +373,7 @@ class QuotesMixin:
         if date:
             params["date"] = date.strftime('%Y-%m-%d')
             
-        if hasattr(self, '_make_request'):
-            return self._make_request("GET", "/marketdata/v1/markets", params=params)
-        else:
-            return self._get("/marketdata/v1/markets", params=params)
+        return self._cached_get("market_hours", "/marketdata/v1/markets", params)
     
     def get_single_market_hours(self, market_id: str, date: Optional[datetime] = None) -> Dict[str, Any]:
         """Get market hours for a specific market.
@@ -248,10 +389,7 @@ class QuotesMixin:
         if date:
             params["date"] = date.strftime('%Y-%m-%d')
             
-        if hasattr(self, '_make_request'):
-            return self._make_request("GET", f"/marketdata/v1/markets/{market_id}", params=params or None)
-        else:
-            return self._get(f"/marketdata/v1/markets/{market_id}", params=params or None)
+        return self._cached_get("market_hours", f"/marketdata/v1/markets/{market_id}", params or None)
     
     # Movers Methods
     def get_movers(self, symbol_id: str, sort: str = "VOLUME", frequency: int = 5) -> Dict[str, Any]:
@@ -267,10 +405,7 @@ class QuotesMixin:
         """
         params = {"sort": sort, "frequency": frequency}
         
-        if hasattr(self, '_make_request'):
-            return self._make_request("GET", f"/marketdata/v1/movers/{symbol_id}", params=params)
-        else:
-            return self._get(f"/marketdata/v1/movers/{symbol_id}", params=params)
+        return self._market_data_get(f"/marketdata/v1/movers/{symbol_id}", params)
     
     # Instruments Methods
     def search_instruments(
@@ -289,10 +424,7 @@ class QuotesMixin:
         """
         params = {"symbol": symbol, "projection": projection}
         
-        if hasattr(self, '_make_request'):
-            return self._make_request("GET", "/marketdata/v1/instruments", params=params)
-        else:
-            return self._get("/marketdata/v1/instruments", params=params)
+        return self._cached_get("instruments", "/marketdata/v1/instruments", params)
     
     def get_instrument_by_cusip(self, cusip_id: str) -> Dict[str, Any]:
         """Get instrument details by CUSIP.
@@ -304,4 +436,4 @@ class QuotesMixin:
             Dictionary containing instrument details
         """
         url = f"/marketdata/v1/instruments/{cusip_id}"
-        return self._make_request("GET", url) if hasattr(self, '_make_request') else self._get(url)
\ No newline at end of file
+        return self._cached_get("instruments", url)
\ No newline at end of file
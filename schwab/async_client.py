@@ -1,7 +1,11 @@
-from typing import List, Optional, Dict, Any, Union
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple, Union
+from datetime import date, datetime, timedelta
+import asyncio
+import copy
+from collections import OrderedDict
 import aiohttp
 from urllib.parse import urljoin
+from pydantic import TypeAdapter
 
 from .models.base import AccountNumbers  # Keep for now - custom aggregation model
 from .models.generated.market_data_models import ErrorResponse, QuoteResponse
@@ -10,28 +14,51 @@ from .models.generated.trading_models import (
 )
 from .api.quotes import QuotesMixin
 
+# Validate whole list responses in one pydantic-core call instead of a per-item Model(**d) loop
+_ACCOUNT_LIST = TypeAdapter(List[Account])
+_ORDER_LIST = TypeAdapter(List[Order])
+
 class AsyncSchwabClient(QuotesMixin):
     """Async client for interacting with the Schwab Trading API."""
     
     TRADING_BASE_URL = "https://api.schwabapi.com/trader/v1"
     MARKET_DATA_BASE_URL = "https://api.schwabapi.com/marketdata/v1"
     
-    def __init__(self, api_key: str):
+    # Slow-changing GET endpoints revalidated with If-None-Match instead of re-downloaded
+    ETAG_ENDPOINT_PREFIXES = ("/marketdata/v1/instruments", "/marketdata/v1/markets")
+    MAX_ETAG_ENTRIES = 256
+    
+    def __init__(self, api_key: str, cache_responses: bool = True):
         """Initialize the client with API credentials.
         
         Args:
             api_key: The API key (Bearer token) for authentication
+            cache_responses: Reuse market data responses for a short per-endpoint TTL
         """
         self.api_key = api_key
+        self.cache_responses = cache_responses
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Accept": "application/json"
         }
         self._session = None
+        # (endpoint, params) -> (etag, payload), least recently used first
+        self._etag_cache: "OrderedDict[tuple, Tuple[str, Any]]" = OrderedDict()
     
     async def __aenter__(self):
         """Create session on context manager enter."""
-        self._session = aiohttp.ClientSession(headers=self.headers)
+        # Pooled keep-alive connections so requests after the first skip the TCP/TLS handshake
+        connector = aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=50,
+            ttl_dns_cache=300,
+            keepalive_timeout=75
+        )
+        self._session = aiohttp.ClientSession(
+            headers=self.headers,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30, connect=5, sock_read=10)
+        )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -69,9 +96,31 @@ class AsyncSchwabClient(QuotesMixin):
             endpoint = f"/trader/v1{endpoint}"
             
         url = urljoin(base_url, endpoint)
-        async with self._session.request(method, url, params=params, json=json) as response:
+        
+        etag_key = None
+        cached = None
+        headers = None
+        if method == "GET" and endpoint.startswith(self.ETAG_ENDPOINT_PREFIXES):
+            etag_key = self._response_cache_key(endpoint, params)
+            cached = self._etag_cache.get(etag_key)
+            if cached:
+                self._etag_cache.move_to_end(etag_key)
+                headers = {"If-None-Match": cached[0]}
+        
+        async with self._session.request(method, url, params=params, json=json, headers=headers) as response:
+            # Use the entry captured above; other requests may evict it while this one awaits.
+            # Callers always get their own copy so mutating a result cannot corrupt the cache.
+            if cached and response.status == 304:
+                return copy.deepcopy(cached[1])
             response.raise_for_status()
-            return await response.json()
+            data = await response.json()
+            etag = response.headers.get("ETag")
+            if etag_key and etag:
+                self._etag_cache.pop(etag_key, None)
+                while len(self._etag_cache) >= self.MAX_ETAG_ENTRIES:
+                    self._etag_cache.popitem(last=False)
+                self._etag_cache[etag_key] = (etag, copy.deepcopy(data))
+            return data
             
     async def _async_get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make an async GET request to the API.
@@ -105,7 +154,7 @@ class AsyncSchwabClient(QuotesMixin):
         data = await self._make_request("GET", "/accounts", params=params)
         if not data:
             return []
-        return [Account(**account) for account in data]
+        return _ACCOUNT_LIST.validate_python(data)
     
     async def get_account(self, account_number: str, include_positions: bool = False) -> Account:
         """Get specific account information.
@@ -158,7 +207,41 @@ class AsyncSchwabClient(QuotesMixin):
         data = await self._make_request("GET", f"/accounts/{account_number}/orders", params=params)
         if not data:
             return []
-        return [Order(**order) for order in data]
+        return _ORDER_LIST.validate_python(data)
+    
+    async def get_accounts_with_orders(
+        self,
+        from_entered_time: datetime,
+        to_entered_time: datetime,
+        max_concurrency: int = 10
+    ) -> List[Tuple[Account, List[Order]]]:
+        """Get all accounts with positions and each account's orders, fetched concurrently.
+        
+        Args:
+            from_entered_time: Start time for order history
+            to_entered_time: End time for order history
+            max_concurrency: Maximum number of order requests in flight at once
+            
+        Returns:
+            List of (account, orders) pairs in the order returned by get_accounts
+        """
+        account_numbers, accounts = await asyncio.gather(
+            self.get_account_numbers(),
+            self.get_accounts(include_positions=True)
+        )
+        # Orders are keyed by the encrypted hash, accounts by the plain number
+        hashes = {a.account_number: a.hash_value for a in account_numbers.accounts}
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch_orders(account: Account) -> List[Order]:
+            account_hash = hashes.get(getattr(account.securities_account, 'account_number', None))
+            if not account_hash:
+                return []
+            async with semaphore:
+                return await self.get_orders(account_hash, from_entered_time, to_entered_time)
+        
+        order_lists = await asyncio.gather(*(fetch_orders(account) for account in accounts))
+        return list(zip(accounts, order_lists))
 
     async def place_order(self, account_number: str, order: Order) -> None:
         """Place an order for a specific account.
@@ -271,7 +354,7 @@ class AsyncSchwabClient(QuotesMixin):
         if strike_count is not None:
             params["strikeCount"] = strike_count
         if include_underlying_quote is not None:
-            params["includeUnderlyingQuote"] = include_underlying_quote
+            params["includeUnderlyingQuote"] = str(include_underlying_quote).lower()
         if strategy:
             params["strategy"] = strategy
         if strike_from_date:
@@ -291,10 +374,48 @@ class AsyncSchwabClient(QuotesMixin):
         if exp_month:
             params["expMonth"] = exp_month
         if option_detail_flag is not None:
-            params["optionDetailFlag"] = option_detail_flag
+            params["optionDetailFlag"] = str(option_detail_flag).lower()
             
         return await self._make_request("GET", "/marketdata/v1/chains", params=params)
     
+    async def get_market_hours_range(
+        self,
+        markets: Union[str, List[str]],
+        start_date: date,
+        end_date: date,
+        max_concurrency: int = 10
+    ) -> Dict[date, Dict[str, Any]]:
+        """Get market hours for every day in a date range, fetched concurrently.
+        
+        Args:
+            markets: Single market or list of markets (equity, option, bond, future, forex)
+            start_date: First day of the range
+            end_date: Last day of the range (inclusive)
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Dictionary mapping each day to its market hours response
+            
+        Raises:
+            ValueError: If end_date is before start_date
+        """
+        if end_date < start_date:
+            raise ValueError(f"end_date {end_date} is before start_date {start_date}")
+        if isinstance(markets, list):
+            markets = ','.join(markets)
+        days = [start_date + timedelta(days=n) for n in range((end_date - start_date).days + 1)]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(day: date) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._async_get(
+                    "/marketdata/v1/markets",
+                    params={"markets": markets, "date": day.strftime('%Y-%m-%d')}
+                )
+        
+        results = await asyncio.gather(*(fetch(day) for day in days))
+        return dict(zip(days, results))
+    
     async def get_option_expiration_chain(self, symbol: str, 
                                          entitlement: str = "np") -> Dict[str, Any]:
         """
@@ -1,10 +1,15 @@
 """Authentication module for Schwab API."""
 import base64
+import threading
+import time
 import urllib.parse
 from typing import Optional, Dict
 import requests
 from datetime import datetime, timedelta
 
+# Refresh tokens this many seconds before they expire
+TOKEN_REFRESH_MARGIN = 60.0
+
 class SchwabAuth:
     """Handles OAuth 2.0 authentication for Schwab API."""
     
@@ -29,7 +34,24 @@ class SchwabAuth:
         self.auth_base_url = auth_base_url
         self.access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
-        self.token_expiry: Optional[datetime] = None
+        self.token_expiry = None
+        self._refresh_lock = threading.Lock()  # One refresh at a time across worker threads
+        
+    @property
+    def token_expiry(self) -> Optional[datetime]:
+        """Expiry time of the current access token."""
+        return self._token_expiry
+    
+    @token_expiry.setter
+    def token_expiry(self, value: Optional[datetime]) -> None:
+        self._token_expiry = value
+        # Cache the deadlines as epoch seconds so the expiry checks are float compares
+        self._expires_at = value.timestamp() if value else None
+        self._refresh_at = self._expires_at - TOKEN_REFRESH_MARGIN if value else None
+    
+    def is_token_expired(self) -> bool:
+        """Return True if there is no token expiry or it has passed."""
+        return self._expires_at is None or time.time() >= self._expires_at
         
     @property
     def authorization_header(self) -> Dict[str, str]:
@@ -158,9 +180,12 @@ class SchwabAuth:
     
     def ensure_valid_token(self) -> None:
         """Ensure we have a valid access token, refreshing if necessary."""
-        if not self.access_token or not self.token_expiry:
+        if not self.access_token or self._refresh_at is None:
             raise ValueError("No access token available. Please authenticate first.")
             
         # Refresh if token is expired or will expire in the next minute
-        if datetime.now() + timedelta(minutes=1) >= self.token_expiry:
-            self.refresh_access_token()
\ No newline at end of file
+        if time.time() >= self._refresh_at:
+            with self._refresh_lock:
+                # Another thread may have refreshed while we waited for the lock
+                if time.time() >= self._refresh_at:
+                    self.refresh_access_token()
\ No newline at end of file
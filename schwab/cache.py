@@ -0,0 +1,53 @@
+"""In-memory TTL cache for market data responses."""
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Seconds a cached response stays fresh, by endpoint kind
+RESPONSE_CACHE_TTLS = {
+    "quotes": 2.0,
+    "price_history": 60.0,
+    "market_hours": 3600.0,
+    "instruments": 7 * 24 * 3600.0,
+}
+
+
+class InMemoryTTLCache:
+    """Thread-safe dict cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, max_entries: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Size at which expired entries are purged; if the cache
+                is still full after purging it is cleared
+        """
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() >= entry[0]:
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds."""
+        now = time.time()
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries = {k: e for k, e in self._entries.items() if e[0] > now}
+                if len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+            self._entries[key] = (now + ttl, value)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
@@ -2,6 +2,7 @@ from typing import List, Optional, Dict, Any, Union, Callable
 from datetime import datetime
 import requests
 from urllib.parse import urljoin
+from pydantic import TypeAdapter
 from decimal import Decimal
 from .auth import SchwabAuth
 from .dual_auth import DualSchwabAuth
@@ -25,6 +26,9 @@ from .order_monitor import OrderMonitor
 from .models.execution import ExecutionReport  # Keep - custom model without generated equivalent
 from .api.quotes import QuotesMixin
 
+# Transaction histories can be long; validate them in one pydantic-core call
+_TRANSACTION_LIST = TypeAdapter(List[Transaction])
+
 class SchwabClient(QuotesMixin):
     """Client for interacting with the Schwab Trading API."""
     
@@ -38,7 +42,8 @@ class SchwabClient(QuotesMixin):
         redirect_uri: str,
         auth: Optional['SchwabAuth'] = None,
         market_data_client_id: Optional[str] = None,
-        market_data_client_secret: Optional[str] = None
+        market_data_client_secret: Optional[str] = None,
+        cache_responses: bool = True
     ):
         """Initialize the client with OAuth credentials.
         
@@ -49,7 +54,9 @@ class SchwabClient(QuotesMixin):
             auth: Optional pre-configured SchwabAuth instance
             market_data_client_id: OAuth client ID for Market Data API (optional)
             market_data_client_secret: OAuth client secret for Market Data API (optional)
+            cache_responses: Reuse market data responses for a short per-endpoint TTL
         """
+        self.cache_responses = cache_responses
         self.session = requests.Session()
         self.session.headers.update({"Accept": "application/json"})
         
@@ -530,7 +537,7 @@ class SchwabClient(QuotesMixin):
         data = self._make_request("GET", f"/accounts/{account_number}/transactions", params=params)
         if not data:
             return []
-        return [Transaction(**txn) for txn in data]
+        return _TRANSACTION_LIST.validate_python(data)
 
     def get_transaction(self, account_number: str, transaction_id: int) -> Transaction:
         """Get details of a specific transaction.
@@ -861,7 +868,7 @@ class SchwabClient(QuotesMixin):
         if strike_count is not None:
             params["strikeCount"] = strike_count
         if include_underlying_quote is not None:
-            params["includeUnderlyingQuote"] = include_underlying_quote
+            params["includeUnderlyingQuote"] = str(include_underlying_quote).lower()
         if strategy:
             params["strategy"] = strategy
         if strike_from_date:
@@ -881,7 +888,7 @@ class SchwabClient(QuotesMixin):
         if exp_month:
             params["expMonth"] = exp_month
         if option_detail_flag is not None:
-            params["optionDetailFlag"] = option_detail_flag
+            params["optionDetailFlag"] = str(option_detail_flag).lower()
             
         return self._make_request("GET", "/marketdata/v1/chains", params=params)
     
@@ -941,8 +948,8 @@ class SchwabClient(QuotesMixin):
         params = {
             "symbol": symbol,
             "periodType": period_type,
-            "needExtendedHoursData": need_extended_hours_data,
-            "needPreviousClose": need_previous_close
+            "needExtendedHoursData": str(need_extended_hours_data).lower(),
+            "needPreviousClose": str(need_previous_close).lower()
         }
         
         if period is not None:
@@ -956,7 +963,7 @@ class SchwabClient(QuotesMixin):
         if end_date is not None:
             params["endDate"] = end_date
             
-        return self._make_request("GET", "/marketdata/v1/pricehistory", params=params)
+        return self._cached_get("price_history", "/marketdata/v1/pricehistory", params)
 def create_stop_limit_order(
     self,
     symbol: str,
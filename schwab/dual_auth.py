@@ -1,4 +1,5 @@
 """Dual authentication module for Schwab Trading and Market Data APIs."""
+import threading
 from typing import Optional, Dict
 from datetime import datetime, timedelta
 from .auth import SchwabAuth
@@ -31,6 +32,7 @@ class DualSchwabAuth:
         self.market_data_auth = None
         if market_data_client_id and market_data_client_secret:
             self.market_data_auth = SchwabAuth(market_data_client_id, market_data_client_secret, redirect_uri)
+        self._market_data_lock = threading.Lock()  # One token fetch at a time across worker threads
     
     def load_market_data_token(self, access_token: str, expiry: Optional[datetime] = None):
         """Load a saved market data token.
@@ -62,15 +64,19 @@ class DualSchwabAuth:
             return
             
         # Check if we need to get a new token
-        if (not self.market_data_auth.access_token or 
-            not self.market_data_auth.token_expiry or
-            datetime.now() >= self.market_data_auth.token_expiry):
-            # Use client credentials grant for market data API
-            try:
-                self.market_data_auth.get_client_credentials_token()
-            except Exception:
-                # If token refresh fails, it might be expired, try getting a new one
-                self.market_data_auth.get_client_credentials_token()
+        if (not self.market_data_auth.access_token or
+            self.market_data_auth.is_token_expired()):
+            with self._market_data_lock:
+                # Another thread may have fetched a token while we waited for the lock
+                if (self.market_data_auth.access_token and
+                    not self.market_data_auth.is_token_expired()):
+                    return
+                # Use client credentials grant for market data API
+                try:
+                    self.market_data_auth.get_client_credentials_token()
+                except Exception:
+                    # If token refresh fails, it might be expired, try getting a new one
+                    self.market_data_auth.get_client_credentials_token()
     
     @property
     def trading_auth_header(self) -> Dict[str, str]:
@@ -1,10 +1,9 @@
 from typing import List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class SchwabBaseModel(BaseModel):
     """Base model for all Schwab API models."""
-    class Config:
-        populate_by_name = True  # Allow population by field name or alias
+    model_config = ConfigDict(populate_by_name=True)  # Allow population by field name or alias
 
 class ErrorResponse(SchwabBaseModel):
     """Error response model."""
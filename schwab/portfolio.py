@@ -9,6 +9,7 @@ view of all account assets, orders, and execution history.
 from typing import Dict, List, Set, Optional, Union, Callable, Any
 from decimal import Decimal
 from datetime import datetime, timedelta
+from collections import defaultdict
 import asyncio
 import json
 import os
@@ -25,6 +26,19 @@ from .models.execution import ExecutionReport
 # Debug mode flag - only for enhanced logging, not for mock data
 DEBUG_MODE = True
 
+
+def _empty_symbol_totals() -> Dict[str, Decimal]:
+    """Zeroed per-symbol totals used by get_portfolio_summary."""
+    return {
+        'quantity': Decimal('0'),
+        'market_value': Decimal('0'),
+        'cost_basis': Decimal('0'),
+        'gain_loss': Decimal('0'),
+        'gain_loss_pct': Decimal('0'),
+        'average_price': Decimal('0')
+    }
+
+
 class PortfolioManager:
     """
     Manages a portfolio of positions across one or more Schwab accounts.
@@ -73,6 +87,8 @@ class PortfolioManager:
         self._orders: Dict[int, Order] = {}  # order_id -> Order
         self._executions: Dict[str, ExecutionReport] = {}  # execution_id -> ExecutionReport
         self._order_callbacks: Dict[int, List[Callable]] = {}  # order_id -> callbacks
+        self._revision = 0  # Bumped whenever account or position data changes
+        self._total_value_cache = (None, Decimal('0'))  # (revision, get_total_value() result)
         
         # Monitoring state
         self._monitoring = False
@@ -133,6 +149,7 @@ class PortfolioManager:
 
             # Add to monitored accounts
             self._monitored_accounts.add(account_number)
+            self._revision += 1
 
     async def add_account_async(self, account_number: str) -> None:
         """
@@ -170,6 +187,7 @@ class PortfolioManager:
 
             # Add to monitored accounts
             self._monitored_accounts.add(account_number)
+            self._revision += 1
 
     def refresh_positions(self) -> None:
         """Refresh all positions for all accounts in the portfolio."""
@@ -180,8 +198,12 @@ class PortfolioManager:
                 account = self.client.get_account(account_number, include_positions=True)
                 
                 with self._lock:
+                    if account == self._accounts.get(account_number):
+                        continue  # Unchanged since the last fetch
+                    
                     # Update account data
                     self._accounts[account_number] = account
+                    self._revision += 1
                     
                     # Initialize position data
                     self._positions[account_number] = {}
@@ -296,8 +318,12 @@ class PortfolioManager:
                 account = await self.client.get_account(account_number, include_positions=True)
                 
                 with self._lock:
+                    if account == self._accounts.get(account_number):
+                        continue  # Unchanged since the last fetch
+                    
                     # Update account data
                     self._accounts[account_number] = account
+                    self._revision += 1
                     
                     # Initialize position data
                     self._positions[account_number] = {}
@@ -544,15 +570,8 @@ class PortfolioManager:
         """
         total_equity = Decimal('0')
         total_cash = Decimal('0')
-        positions_by_symbol = {}
-        positions_by_asset_class = {
-            'EQUITY': Decimal('0'),
-            'OPTION': Decimal('0'),
-            'MUTUAL_FUND': Decimal('0'),
-            'FIXED_INCOME': Decimal('0'),
-            'FOREX': Decimal('0'),
-            'INDEX': Decimal('0')
-        }
+        positions_by_symbol = defaultdict(_empty_symbol_totals)
+        positions_by_asset_class = defaultdict(Decimal)
         
         # Refresh positions before summary if monitoring active (skip manual/test setups)
         if self._monitored_accounts:
@@ -695,46 +714,33 @@ class PortfolioManager:
                     account_equity += market_value
                     
                     # Aggregate positions by symbol
-                    if symbol not in positions_by_symbol:
-                        positions_by_symbol[symbol] = {
-                            'quantity': Decimal('0'),
-                            'market_value': Decimal('0'),
-                            'cost_basis': Decimal('0'),
-                            'gain_loss': Decimal('0'),
-                            'gain_loss_pct': Decimal('0'),
-                            'average_price': Decimal('0')
-                        }
+                    totals = positions_by_symbol[symbol]
                     
                     # Extract position quantities
                     long_qty = self._extract_decimal_field(position, 'long_quantity', Decimal('0'))
                     short_qty = self._extract_decimal_field(position, 'short_quantity', Decimal('0'))
                     
                     net_qty = long_qty - short_qty
-                    positions_by_symbol[symbol]['quantity'] += net_qty
-                    positions_by_symbol[symbol]['market_value'] += market_value
+                    totals['quantity'] += net_qty
+                    totals['market_value'] += market_value
                     
                     # Extract average price
                     avg_price = self._extract_decimal_field(position, 'average_price', Decimal('0'))
-                    positions_by_symbol[symbol]['average_price'] = avg_price
+                    totals['average_price'] = avg_price
                     
                     # Calculate cost basis
                     cost_basis = avg_price * long_qty
-                    positions_by_symbol[symbol]['cost_basis'] += cost_basis
+                    totals['cost_basis'] += cost_basis
                     
                     # Calculate gain/loss
                     if cost_basis > 0:
                         gain_loss = market_value - cost_basis
                         gain_loss_pct = (gain_loss / cost_basis) * Decimal('100')
-                        positions_by_symbol[symbol]['gain_loss'] = gain_loss
-                        positions_by_symbol[symbol]['gain_loss_pct'] = gain_loss_pct
-                    
-                    # Determine asset class
-                    asset_type_str = self._determine_asset_type(position)
+                        totals['gain_loss'] = gain_loss
+                        totals['gain_loss_pct'] = gain_loss_pct
                     
                     # Add to asset class totals
-                    if asset_type_str not in positions_by_asset_class:
-                        positions_by_asset_class[asset_type_str] = Decimal('0')
-                    positions_by_asset_class[asset_type_str] += market_value
+                    positions_by_asset_class[self._determine_asset_type(position)] += market_value
 
                 except Exception as e:
                     pass
@@ -769,9 +775,9 @@ class PortfolioManager:
             cash_allocation = Decimal('0')
             equity_allocation = Decimal('0')
         
-        # Calculate asset class allocation percentages
+        # Calculate asset class allocation percentages, in a stable order across refreshes
         asset_allocation = {}
-        for asset_class, value in positions_by_asset_class.items():
+        for asset_class, value in sorted(positions_by_asset_class.items()):
             if total_value > 0 and value > 0:
                 raw_pct = value / total_value * Decimal('100')
                 asset_allocation[asset_class] = raw_pct.quantize(quant)
@@ -791,7 +797,7 @@ class PortfolioManager:
             'total_cash': total_cash,
             'cash_allocation': cash_allocation,
             'equity_allocation': equity_allocation,
-            'positions_by_symbol': positions_by_symbol,
+            'positions_by_symbol': dict(positions_by_symbol),
             'asset_allocation': asset_allocation,
             'accounts': list(self._accounts.keys()),
             'open_orders': len([o for o in self._orders.values() if o.status == OrderStatus.WORKING]),
@@ -1271,6 +1277,15 @@ class PortfolioManager:
         """Get all accounts in the portfolio."""
         return self._accounts
     
+    @property
+    def revision(self) -> int:
+        """Counter that increases whenever account or position data changes.
+        
+        Callers can compare it with a previously seen value to skip
+        recomputing views of unchanged data.
+        """
+        return self._revision
+    
     def update(self) -> None:
         """Update all account and position data."""
         with self._lock:
@@ -1278,7 +1293,10 @@ class PortfolioManager:
                 try:
                     # Get fresh account data with positions
                     account = self.client.get_account(account_number, include_positions=True)
+                    if account == self._accounts.get(account_number):
+                        continue  # Unchanged since the last fetch
                     self._accounts[account_number] = account
+                    self._revision += 1
                     
                     # Update positions
                     self._positions[account_number] = {}
@@ -1293,7 +1311,15 @@ class PortfolioManager:
                     pass
 
     def get_total_value(self) -> Decimal:
-        """Get total portfolio value across all accounts."""
+        """Get total portfolio value across all accounts.
+        
+        The result is cached until the next change to account data.
+        """
+        revision = self._revision
+        cached_revision, total = self._total_value_cache
+        if cached_revision == revision:
+            return total
+            
         total = Decimal('0')
         for account_number, account in self._accounts.items():
             try:
@@ -1319,6 +1345,7 @@ class PortfolioManager:
             except Exception as e:
                 pass
 
+        self._total_value_cache = (revision, total)
         return total
     
     def get_total_cash(self) -> Decimal:
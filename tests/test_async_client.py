@@ -0,0 +1,119 @@
+"""Tests for the concurrent AsyncSchwabClient helpers."""
+
+import asyncio
+from datetime import date, datetime
+
+import pytest
+
+from schwab.async_client import AsyncSchwabClient
+
+
+class TestGetAccountsWithOrders:
+    """Test suite for AsyncSchwabClient.get_accounts_with_orders."""
+
+    def _make_client(self, account_count):
+        """Build a client whose _make_request serves accounts and per-hash orders."""
+        client = AsyncSchwabClient(api_key="test_key")
+        numbers = [str(100 + i) for i in range(account_count)]
+        client.in_flight = 0
+        client.max_in_flight = 0
+
+        async def make_request(method, endpoint, params=None, json=None):
+            if endpoint == "/accounts/accountNumbers":
+                return [{"accountNumber": n, "hashValue": f"hash-{n}"} for n in numbers]
+            if endpoint == "/accounts":
+                return [{"securitiesAccount": {"accountNumber": n, "type": "CASH"}} for n in numbers]
+            client.in_flight += 1
+            client.max_in_flight = max(client.max_in_flight, client.in_flight)
+            # Yield so the other order requests get a chance to start
+            await asyncio.sleep(0.01)
+            client.in_flight -= 1
+            account_hash = endpoint.split("/")[2]
+            return [{"orderId": int(account_hash.split("-")[1])}]
+
+        client._make_request = make_request
+        return client
+
+    def test_orders_attached_to_matching_accounts(self):
+        """Each account is paired with the orders fetched for its hash."""
+        client = self._make_client(3)
+
+        result = asyncio.run(client.get_accounts_with_orders(
+            datetime(2024, 1, 1), datetime(2024, 1, 31)
+        ))
+
+        assert len(result) == 3
+        for account, orders in result:
+            number = account.securities_account.account_number
+            assert [order.order_id for order in orders] == [int(number)]
+
+    def test_concurrency_capped(self):
+        """No more than max_concurrency order requests are in flight at once."""
+        client = self._make_client(8)
+
+        result = asyncio.run(client.get_accounts_with_orders(
+            datetime(2024, 1, 1), datetime(2024, 1, 31), max_concurrency=3
+        ))
+
+        assert len(result) == 8
+        assert client.max_in_flight == 3
+
+
+class TestGetMarketHoursRange:
+    """Test suite for AsyncSchwabClient.get_market_hours_range."""
+
+    def _make_client(self):
+        """Build a client whose _make_request echoes the requested params."""
+        client = AsyncSchwabClient(api_key="test_key")
+        client.requests = []
+
+        async def make_request(method, endpoint, params=None, json=None):
+            client.requests.append((endpoint, params))
+            return {"date": params["date"], "markets": params["markets"]}
+
+        client._make_request = make_request
+        return client
+
+    def test_inclusive_range_maps_dates_to_responses(self):
+        """Every day from start to end inclusive maps to its own response."""
+        client = self._make_client()
+
+        result = asyncio.run(client.get_market_hours_range(
+            "equity", date(2024, 3, 1), date(2024, 3, 3)
+        ))
+
+        assert list(result) == [date(2024, 3, 1), date(2024, 3, 2), date(2024, 3, 3)]
+        for day, hours in result.items():
+            assert hours == {"date": day.strftime("%Y-%m-%d"), "markets": "equity"}
+        assert {endpoint for endpoint, _ in client.requests} == {"/marketdata/v1/markets"}
+
+    def test_single_day(self):
+        """A range whose start and end match makes one request."""
+        client = self._make_client()
+
+        result = asyncio.run(client.get_market_hours_range(
+            "option", date(2024, 3, 1), date(2024, 3, 1)
+        ))
+
+        assert list(result) == [date(2024, 3, 1)]
+        assert len(client.requests) == 1
+
+    def test_markets_list_joined(self):
+        """A list of markets is sent as one comma-separated parameter."""
+        client = self._make_client()
+
+        asyncio.run(client.get_market_hours_range(
+            ["equity", "option"], date(2024, 3, 1), date(2024, 3, 1)
+        ))
+
+        assert client.requests[0][1]["markets"] == "equity,option"
+
+    def test_end_before_start_raises(self):
+        """An inverted range raises instead of returning an empty result."""
+        client = self._make_client()
+
+        with pytest.raises(ValueError):
+            asyncio.run(client.get_market_hours_range(
+                "equity", date(2024, 3, 2), date(2024, 3, 1)
+            ))
+        assert client.requests == []
@@ -190,4 +190,21 @@ class TestSchwabAuth:
         auth.ensure_valid_token()
         
         # Should not have called refresh
-        auth.refresh_access_token.assert_not_called()
\ No newline at end of file
+        auth.refresh_access_token.assert_not_called()
+    
+    def test_is_token_expired(self):
+        """Test token expiry check."""
+        auth = SchwabAuth(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            redirect_uri="test_redirect_uri"
+        )
+        
+        # No expiry counts as expired
+        assert auth.is_token_expired()
+        
+        auth.token_expiry = datetime.now() - timedelta(seconds=1)
+        assert auth.is_token_expired()
+        
+        auth.token_expiry = datetime.now() + timedelta(minutes=10)
+        assert not auth.is_token_expired()
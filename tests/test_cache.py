@@ -0,0 +1,186 @@
+"""Tests for the market data response cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from schwab.async_client import AsyncSchwabClient
+from schwab.cache import InMemoryTTLCache
+
+
+class TestInMemoryTTLCache:
+    """Test suite for InMemoryTTLCache."""
+    
+    def test_get_before_and_after_expiry(self):
+        """Entries are returned until their TTL elapses."""
+        cache = InMemoryTTLCache()
+        with patch('schwab.cache.time.time', return_value=1000.0):
+            cache.set("key", {"a": 1}, ttl=2.0)
+            assert cache.get("key") == {"a": 1}
+        with patch('schwab.cache.time.time', return_value=1002.0):
+            assert cache.get("key") is None
+        assert cache.get("missing") is None
+    
+    def test_full_cache_purges_expired(self):
+        """Expired entries are dropped when the cache fills up."""
+        cache = InMemoryTTLCache(max_entries=2)
+        with patch('schwab.cache.time.time', return_value=1000.0):
+            cache.set("old", 1, ttl=1.0)
+            cache.set("fresh", 2, ttl=60.0)
+        with patch('schwab.cache.time.time', return_value=1010.0):
+            cache.set("new", 3, ttl=60.0)
+            assert cache.get("old") is None
+            assert cache.get("fresh") == 2
+            assert cache.get("new") == 3
+
+
+class TestClientResponseCache:
+    """Test suite for the market data response cache on the clients."""
+    
+    def test_client_reuses_price_history(self, mock_client):
+        """Repeated price history requests within the TTL hit the API once."""
+        mock_client._make_request.return_value = {"candles": []}
+        
+        assert mock_client.get_price_history("AAPL") == {"candles": []}
+        assert mock_client.get_price_history("AAPL") == {"candles": []}
+        mock_client._make_request.assert_called_once()
+        
+        mock_client.get_price_history("MSFT")
+        assert mock_client._make_request.call_count == 2
+    
+    def test_cached_response_is_not_shared(self, mock_client):
+        """Editing a returned payload does not change the cached copy."""
+        mock_client._make_request.return_value = {"candles": [{"close": 1.0}]}
+        
+        first = mock_client.get_price_history("AAPL")
+        first["candles"][0]["close"] = 99.0
+        first["extra"] = True
+        
+        assert mock_client.get_price_history("AAPL") == {"candles": [{"close": 1.0}]}
+        mock_client._make_request.assert_called_once()
+    
+    def test_async_client_caches_awaited_response(self):
+        """Async clients cache the awaited payload instead of the coroutine."""
+        client = AsyncSchwabClient(api_key="test_key")
+        client._make_request = AsyncMock(return_value={"equity": {}})
+        
+        async def fetch_twice():
+            return (await client.get_market_hours("equity"),
+                    await client.get_market_hours("equity"))
+        
+        first, second = asyncio.run(fetch_twice())
+        assert first == second == {"equity": {}}
+        client._make_request.assert_awaited_once()
+    
+    def test_get_quotes_bypasses_cache(self, mock_client):
+        """use_cache=False fetches quotes even when a fresh response is cached."""
+        mock_client._make_request.return_value = {}
+        
+        mock_client.get_quotes("AAPL")
+        mock_client.get_quotes("AAPL")
+        mock_client._make_request.assert_called_once()
+        
+        mock_client.get_quotes("AAPL", use_cache=False)
+        assert mock_client._make_request.call_count == 2
+    
+    def test_client_with_cache_disabled(self):
+        """A client created with cache_responses=False always fetches."""
+        client = AsyncSchwabClient(api_key="test_key", cache_responses=False)
+        client._make_request = AsyncMock(return_value={"equity": {}})
+        
+        async def fetch_twice():
+            await client.get_market_hours("equity")
+            await client.async_get_quotes("AAPL")
+            await client.get_market_hours("equity")
+            await client.async_get_quotes("AAPL")
+        
+        asyncio.run(fetch_twice())
+        assert client._make_request.await_count == 4
+
+
+class _FakeResponse:
+    """Minimal aiohttp response stand-in."""
+    
+    def __init__(self, status, payload=None, headers=None, on_enter=None):
+        self.status = status
+        self.payload = payload
+        self.headers = headers or {}
+        self.on_enter = on_enter
+    
+    def raise_for_status(self):
+        pass
+    
+    async def json(self):
+        return self.payload
+    
+    async def __aenter__(self):
+        if self.on_enter:
+            self.on_enter()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class TestAsyncClientETag:
+    """Test suite for ETag revalidation in AsyncSchwabClient."""
+    
+    def test_etag_stored_and_reused_on_304(self):
+        """A 200 with an ETag is stored and a later 304 returns the stored payload."""
+        client = AsyncSchwabClient(api_key="test_key")
+        client._session = MagicMock()
+        endpoint = "/marketdata/v1/markets"
+        params = {"markets": "equity"}
+        client._session.request.side_effect = [
+            _FakeResponse(200, {"hours": 1}, {"ETag": '"v1"'}),
+            # Another request clears the cache while this one is in flight
+            _FakeResponse(304, on_enter=client._etag_cache.clear),
+        ]
+        
+        first = asyncio.run(client._make_request("GET", endpoint, params=params))
+        assert first == {"hours": 1}
+        assert client._etag_cache[client._response_cache_key(endpoint, params)] == ('"v1"', {"hours": 1})
+        
+        second = asyncio.run(client._make_request("GET", endpoint, params=params))
+        assert second == {"hours": 1}
+        _, kwargs = client._session.request.call_args
+        assert kwargs["headers"] == {"If-None-Match": '"v1"'}
+    
+    def test_etag_payload_is_not_shared(self):
+        """Mutating a fetched or revalidated payload does not change later 304 results."""
+        client = AsyncSchwabClient(api_key="test_key")
+        client._session = MagicMock()
+        endpoint = "/marketdata/v1/markets"
+        client._session.request.side_effect = [
+            _FakeResponse(200, {"hours": [1]}, {"ETag": '"v1"'}),
+            _FakeResponse(304),
+            _FakeResponse(304),
+        ]
+        
+        first = asyncio.run(client._make_request("GET", endpoint))
+        first["hours"].append(2)
+        second = asyncio.run(client._make_request("GET", endpoint))
+        assert second == {"hours": [1]}
+        second["hours"].append(3)
+        third = asyncio.run(client._make_request("GET", endpoint))
+        assert third == {"hours": [1]}
+    
+    def test_etag_cache_evicts_least_recently_used(self):
+        """A full cache drops only its least recently used validator."""
+        client = AsyncSchwabClient(api_key="test_key")
+        client.MAX_ETAG_ENTRIES = 2
+        client._session = MagicMock()
+        endpoint = "/marketdata/v1/instruments"
+        client._session.request.side_effect = [
+            _FakeResponse(200, {"n": 1}, {"ETag": '"a"'}),
+            _FakeResponse(200, {"n": 2}, {"ETag": '"b"'}),
+            _FakeResponse(304),
+            _FakeResponse(200, {"n": 3}, {"ETag": '"c"'}),
+        ]
+        
+        for symbol in ("A", "B", "A", "C"):
+            asyncio.run(client._make_request("GET", endpoint, params={"symbol": symbol}))
+        
+        keys = [client._response_cache_key(endpoint, {"symbol": s}) for s in ("A", "B", "C")]
+        assert keys[0] in client._etag_cache
+        assert keys[1] not in client._etag_cache
+        assert keys[2] in client._etag_cache
@@ -55,6 +55,29 @@ class TestPortfolioManager:
         assert portfolio._accounts["account1"] == mock_account1
         assert portfolio._accounts["account2"] == mock_account2
         
+    def test_update_revision(self, mock_client):
+        """Test that update and refresh_positions only bump the revision when account data changes."""
+        test_account = create_test_account()
+        test_account.securities_account.positions = []
+        mock_client.get_account.return_value = test_account
+        
+        portfolio = PortfolioManager(mock_client)
+        portfolio.add_account("test_account")
+        revision = portfolio.revision
+        
+        # Same account data: nothing changed
+        mock_client.get_account.return_value = test_account.model_copy(deep=True)
+        portfolio.update()
+        portfolio.refresh_positions()
+        assert portfolio.revision == revision
+        
+        # Different account data: revision moves on
+        changed_account = test_account.model_copy(deep=True)
+        changed_account.securities_account.current_balances.cash_balance = Decimal("9000.00")
+        mock_client.get_account.return_value = changed_account
+        portfolio.update()
+        assert portfolio.revision > revision
+        
     def test_place_order(self, mock_client):
         """Test placing an order."""
         # Mock account
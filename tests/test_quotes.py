@@ -208,4 +208,17 @@ class TestQuotes:
         
         # Test dictionary-like access
         assert response["AAPL"].symbol == "AAPL"
-        assert response["MSFT"].symbol == "MSFT"
\ No newline at end of file
+        assert response["MSFT"].symbol == "MSFT"
+    
+    def test_get_quotes_bulk_chunks_and_dedupes(self, mock_client):
+        """Test bulk quotes split deduplicated symbols into sorted chunks."""
+        mock_client._make_request = MagicMock(side_effect=lambda method, endpoint, params=None: {
+            symbol: {"assetMainType": "EQUITY", "symbol": symbol}
+            for symbol in params["symbols"].split(",")
+        })
+        
+        result = mock_client.get_quotes_bulk(["MSFT", "AAPL", "MSFT", "IBM"], chunk_size=2)
+        
+        assert set(result.root) == {"AAPL", "IBM", "MSFT"}
+        requested = [kwargs["params"]["symbols"] for _, kwargs in mock_client._make_request.call_args_list]
+        assert requested == ["AAPL,IBM", "MSFT"]